@@ -1,5 +1,6 @@
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 from uuid import UUID
 
@@ -10,7 +11,7 @@ from core.infrastructure.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CurrencyPrice:
     amount: float
     currency: str
@@ -58,7 +59,7 @@ async def yearly_reward(user_id: UUID, payment: Payment, recurring_details: dict
 RewardStrategy = Callable[[UUID, Payment, dict[str, Any], Any], Awaitable[None]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PaymentProduct:
     product_id: str
     name: str
@@ -66,9 +67,14 @@ class PaymentProduct:
     prices: dict[str, CurrencyPrice]
     recurring: bool = False
     reward_handler: RewardStrategy = field(default=default_reward)
+    # First listed price, used for currencies the product has no price in
+    _default_price: CurrencyPrice | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_default_price", next(iter(self.prices.values()), None))
 
     def get_price_for(self, currency: str) -> CurrencyPrice:
-        return self.prices.get(currency) or next(iter(self.prices.values()))
+        return self.prices.get(currency) or self._default_price
 
     async def reward(self, user_id: UUID, payment: Payment, recurring_details: dict, subscriptions_service) -> None:
         await self.reward_handler(user_id, payment, recurring_details, subscriptions_service)
@@ -181,6 +187,10 @@ CURRENT_OFFERS = AVAILABLE_PRODUCTS
 # Combined dictionary for internal use (contains ALL products)
 ALL_PRODUCTS = {**LEGACY_PRODUCTS, **AVAILABLE_PRODUCTS}
 
+# Read-only lookup views for get_product, built once at import
+_ALL_PRODUCTS_VIEW = MappingProxyType(ALL_PRODUCTS)
+_ALL_PRODUCTS_DEBUG_VIEW = MappingProxyType({**ALL_PRODUCTS, **TEST_PRODUCTS})
+
 
 def get_product(product_id: str) -> PaymentProduct | None:
     """
@@ -194,8 +204,5 @@ def get_product(product_id: str) -> PaymentProduct | None:
         PaymentProduct or None if not found
     """
     # Include test products in debug mode
-    if settings.debug:
-        all_products = {**ALL_PRODUCTS, **TEST_PRODUCTS}
-        return all_products.get(product_id)
-
-    return ALL_PRODUCTS.get(product_id)
+    products = _ALL_PRODUCTS_DEBUG_VIEW if settings.debug else _ALL_PRODUCTS_VIEW
+    return products.get(product_id)
@@ -20,12 +20,7 @@ class BalanceService(BaseService):
 
     async def get_or_create_balance(self, user_id: UUID):
         """Get user balance or create with defaults if doesn't exist."""
-        balance = await self.repo.balance.get_by_id(user_id)
-        if balance:
-            return balance
-
-        # Create default balance for new user
-        return await self.repo.balance.create({"user_id": user_id})
+        return await self.repo.balance.get_or_create(user_id)
 
     async def get_balance(self, user_id: UUID):
         """Get user balance."""
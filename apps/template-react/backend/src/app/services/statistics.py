@@ -39,43 +39,18 @@ class StatisticsService(BaseService):
         today_str = today_start.strftime("%Y-%m-%d")
 
         try:
-            # User statistics using repository methods
-            total_users = await self.repo.users.get_users_count()
-            new_users_today = await self.repo.users.get_new_users_count(today_start)
-            new_users_this_week = await self.repo.users.get_new_users_count(week_ago_start)
-            new_users_this_month = await self.repo.users.get_new_users_count(month_ago_start)
-            daily_active_users = await self.repo.users.get_updated_users_count(today_start, today_end)
-            weekly_active_users = await self.repo.users.get_updated_users_count(week_ago_start, today_end)
-            monthly_active_users = await self.repo.users.get_updated_users_count(month_ago_start, today_end)
-
-            # Revenue and product statistics using repository methods
-            total_revenue = await self.repo.payments.get_total_revenue_by_currency()
-            today_revenue = await self.repo.payments.get_revenue_by_all_currencies_and_date(today_start, today_end)
-            total_product_sales = await self.repo.payments.get_product_sales_stats()
-            today_product_sales = await self.repo.payments.get_product_sales_stats_by_date(today_start, today_end)
-
-            # Subscription statistics using repository methods
+            # One query for user counts, two for revenue and product sales
+            user_counts = await self.repo.users.get_activity_counts(
+                today_start, week_ago_start, month_ago_start, today_end
+            )
+            payment_stats = await self.repo.payments.get_revenue_and_sales_stats(today_start, today_end)
             active_subscribers = await self.repo.subscriptions.get_active_subscribers_count()
 
             return {
                 "date": today_str,
-                "users": {
-                    "total": total_users,
-                    "new_today": new_users_today,
-                    "new_this_week": new_users_this_week,
-                    "new_this_month": new_users_this_month,
-                    "dau": daily_active_users,
-                    "wau": weekly_active_users,
-                    "mau": monthly_active_users,
-                },
-                "revenue": {
-                    "alltime": total_revenue,
-                    "today": today_revenue,
-                },
-                "product_sales": {
-                    "alltime": total_product_sales,
-                    "today": today_product_sales,
-                },
+                "users": user_counts,
+                "revenue": payment_stats["revenue"],
+                "product_sales": payment_stats["product_sales"],
                 "subscriptions": {
                     "active_subscribers": active_subscribers,
                 },
@@ -105,59 +80,62 @@ class StatisticsService(BaseService):
         if "error" in stats:
             return f"📊 DAILY STATISTICS ({stats['date']})\n\n❌ {stats['error']}"
 
-        message = f"📊 DAILY STATISTICS ({stats['date']})\n\n"
-
-        # Users section
-        message += "👥 USERS:\n"
-        message += f"  - Total: {stats['users']['total']:,}\n"
-        message += f"  - MAU: {stats['users']['mau']:,}\n"
-        message += f"  - WAU: {stats['users']['wau']:,}\n"
-        message += f"  - DAU: {stats['users']['dau']:,}\n"
-        message += f"  - NEW this month: {stats['users']['new_this_month']:,}\n"
-        message += f"  - NEW this week: {stats['users']['new_this_week']:,}\n"
-        message += f"  - NEW today: {stats['users']['new_today']:,}\n\n"
-
-        # Subscriptions section
-        message += "💎 SUBSCRIPTIONS:\n"
-        message += f"  - Active subscribers: {stats['subscriptions']['active_subscribers']:,}\n\n"
-
-        # Revenue section
-        message += "💰 REVENUE:\n"
-        message += "  - ALL-TIME:\n"
-        if stats["revenue"]["alltime"]:
-            for currency, amount in stats["revenue"]["alltime"].items():
-                message += f"    - {amount:.2f} {currency}\n"
+        users = stats["users"]
+        revenue = stats["revenue"]
+        product_sales = stats["product_sales"]
+
+        parts = [
+            f"📊 DAILY STATISTICS ({stats['date']})\n\n",
+            # Users section
+            "👥 USERS:\n",
+            f"  - Total: {users['total']:,}\n",
+            f"  - MAU: {users['mau']:,}\n",
+            f"  - WAU: {users['wau']:,}\n",
+            f"  - DAU: {users['dau']:,}\n",
+            f"  - NEW this month: {users['new_this_month']:,}\n",
+            f"  - NEW this week: {users['new_this_week']:,}\n",
+            f"  - NEW today: {users['new_today']:,}\n\n",
+            # Subscriptions section
+            "💎 SUBSCRIPTIONS:\n",
+            f"  - Active subscribers: {stats['subscriptions']['active_subscribers']:,}\n\n",
+            # Revenue section
+            "💰 REVENUE:\n",
+            "  - ALL-TIME:\n",
+        ]
+        if revenue["alltime"]:
+            parts.extend(f"    - {amount:.2f} {currency}\n" for currency, amount in revenue["alltime"].items())
         else:
-            message += "    - 0\n"
+            parts.append("    - 0\n")
 
-        message += "  - TODAY:\n"
-        if stats["revenue"]["today"]:
-            for currency, amount in stats["revenue"]["today"].items():
-                message += f"    - {amount:.2f} {currency}\n"
+        parts.append("  - TODAY:\n")
+        if revenue["today"]:
+            parts.extend(f"    - {amount:.2f} {currency}\n" for currency, amount in revenue["today"].items())
         else:
-            message += "    - 0\n"
+            parts.append("    - 0\n")
 
-        message += "\n"
+        parts.append("\n")
 
         # Product sales section
-        message += "🛒 PRODUCT SALES:\n"
-        message += "  - ALL-TIME:\n"
-        if stats["product_sales"]["alltime"]:
-            for product_id, count in stats["product_sales"]["alltime"].items():
-                message += f"    - {product_id}: {count:,} sold\n"
+        parts.append("🛒 PRODUCT SALES:\n")
+        parts.append("  - ALL-TIME:\n")
+        if product_sales["alltime"]:
+            parts.extend(
+                f"    - {product_id}: {count:,} sold\n" for product_id, count in product_sales["alltime"].items()
+            )
         else:
-            message += "    - No sales yet\n"
+            parts.append("    - No sales yet\n")
 
-        message += "  - TODAY:\n"
-        if stats["product_sales"]["today"]:
-            for product_id, count in stats["product_sales"]["today"].items():
-                message += f"    - {product_id}: {count:,} sold\n"
+        parts.append("  - TODAY:\n")
+        if product_sales["today"]:
+            parts.extend(
+                f"    - {product_id}: {count:,} sold\n" for product_id, count in product_sales["today"].items()
+            )
         else:
-            message += "    - No sales today\n"
+            parts.append("    - No sales today\n")
 
         # Add app-specific sections here as needed
         # Example:
-        # message += "\n🎯 APP-SPECIFIC METRICS:\n"
-        # message += f"  - Custom metric: {stats.get('custom_metric', 0):,}\n"
+        # parts.append("\n🎯 APP-SPECIFIC METRICS:\n")
+        # parts.append(f"  - Custom metric: {stats.get('custom_metric', 0):,}\n")
 
-        return message
+        return "".join(parts)
@@ -10,7 +10,6 @@ from httpx import ASGITransport, AsyncClient
 # Import Balance model FIRST before any core imports
 # This ensures it's registered in SQLAlchemy before core's conftest runs
 from app.infrastructure.database.models.balance import Balance  # noqa: F401
-from app.webhook.routers.demo import _counters
 
 
 @pytest_asyncio.fixture
@@ -27,11 +26,3 @@ async def client():
         base_url="http://test",
     ) as client:
         yield client
-
-
-@pytest_asyncio.fixture(autouse=True)
-async def reset_demo_counters():
-    """Reset all demo counters before each test to ensure isolation."""
-    _counters.clear()
-    yield
-    _counters.clear()
@@ -8,6 +8,8 @@ Full integration tests should be run with the Docker infrastructure.
 import pytest
 from httpx import AsyncClient
 
+pytestmark = pytest.mark.asyncio
+
 SKIP_REASON = "Requires full infrastructure (Redis for sessions/tokens)"
 
 
@@ -14,6 +14,7 @@ from app.exceptions import BackendException
 from app.infrastructure.database.repo.requests import RequestsRepo
 from app.webhook import routers
 from app.webhook.auth import get_user as app_get_user
+from app.webhook.dependencies.bot import close_bot
 from app.webhook.dependencies.service import get_services as app_get_services
 from core.infrastructure.auth.telegram import TelegramAuthenticator
 from core.infrastructure.config import settings
@@ -78,6 +79,7 @@ app = create_api(
     version=release_version,
     static_path=Path(__file__).parent.parent / "static",
     root_path=settings.web.api_root_path,  # Configurable: "" for subdomain, "/api/template" for path-based
+    on_shutdown=[close_bot],
     security_csp=(
         "default-src 'self'; "
         "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.tailwindcss.com https://cdn.jsdelivr.net https://js.posthog.com; "
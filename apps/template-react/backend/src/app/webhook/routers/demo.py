@@ -14,6 +14,7 @@ These endpoints demonstrate data fetching patterns:
 
 import asyncio
 import random
+import time
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -21,27 +22,19 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.services.requests import RequestsService
+from app.webhook.dependencies.redis import get_redis_client
 from app.webhook.dependencies.service import get_services
+from core.infrastructure.config import settings
 from core.infrastructure.fastapi.dependencies import get_user
+from core.infrastructure.fastapi.responses import PydanticJSONResponse
+from core.infrastructure.redis import RedisClient
 from core.schemas.users import UserSchema
 
-router = APIRouter(prefix="/demo", tags=["demo"])
+router = APIRouter(prefix="/demo", tags=["demo"], default_response_class=PydanticJSONResponse)
 
-# In-memory counters per ID for demo (resets on restart)
-_counters: dict[str, int] = {}
-
-
-# Mock data for demos
-class MockItem:
-    __slots__ = ("id", "title", "description")
-
-    def __init__(self, id: int, title: str, description: str):
-        self.id = id
-        self.title = title
-        self.description = description
-
-
-_MOCK_ITEMS = [MockItem(id=i, title=f"Item {i}", description=f"Description for item {i}") for i in range(1, 101)]
+# Demo counters live in Redis so every worker sees the same value; idle ones expire
+_COUNTER_KEY_PREFIX = f"{settings.app_name}:demo:counter:"
+_COUNTER_TTL_SECONDS = 60 * 60
 
 
 class SlowResponse(BaseModel):
@@ -96,14 +89,17 @@ async def unreliable_endpoint(fail_rate: float = Query(default=0.5, ge=0, le=1))
 
 
 @router.get("/counter", response_model=CounterResponse)
-async def get_counter(counter_id: str = Query(default="default")):
+async def get_counter(
+    counter_id: str = Query(default="default"),
+    redis: RedisClient = Depends(get_redis_client),
+):
     """Get current counter value for cache demo.
 
     Args:
         counter_id: Unique counter ID (default: "default"). Use different IDs
                    to avoid conflicts between users/sessions.
     """
-    value = _counters.get(counter_id, 0)
+    value = int(await redis.get(f"{_COUNTER_KEY_PREFIX}{counter_id}") or 0)
     return CounterResponse(
         value=value,
         counter_id=counter_id,
@@ -116,6 +112,7 @@ async def increment_counter(
     counter_id: str = Query(default="default"),
     amount: int = Query(default=1, ge=1, le=100),
     should_fail: bool = Query(default=False),
+    redis: RedisClient = Depends(get_redis_client),
 ):
     """
     Increment counter for optimistic update demo.
@@ -130,23 +127,25 @@ async def increment_counter(
         await asyncio.sleep(0.5)
         raise HTTPException(status_code=500, detail="Intentional failure for rollback demo")
 
-    current = _counters.get(counter_id, 0)
-    _counters[counter_id] = current + amount
+    value = await redis.incrby(f"{_COUNTER_KEY_PREFIX}{counter_id}", amount, ex=_COUNTER_TTL_SECONDS)
     return CounterResponse(
-        value=_counters[counter_id],
+        value=value,
         counter_id=counter_id,
         timestamp=datetime.now(UTC).isoformat(),
     )
 
 
 @router.post("/counter/reset", response_model=CounterResponse)
-async def reset_counter(counter_id: str = Query(default="default")):
+async def reset_counter(
+    counter_id: str = Query(default="default"),
+    redis: RedisClient = Depends(get_redis_client),
+):
     """Reset counter to 0.
 
     Args:
         counter_id: Unique counter ID (default: "default")
     """
-    _counters[counter_id] = 0
+    await redis.set(f"{_COUNTER_KEY_PREFIX}{counter_id}", "0", ex=_COUNTER_TTL_SECONDS)
     return CounterResponse(
         value=0,
         counter_id=counter_id,
@@ -218,6 +217,10 @@ class PaginatedItem(BaseModel):
     description: str
 
 
+# Built once: pages are slices of this list, no per-request model construction
+_MOCK_ITEMS = [PaginatedItem(id=i, title=f"Item {i}", description=f"Description for item {i}") for i in range(1, 101)]
+
+
 class PaginatedResponse(BaseModel):
     items: list[PaginatedItem]
     next_cursor: int | None
@@ -250,7 +253,7 @@ async def get_paginated_items(
     has_more = next_cursor is not None
 
     return PaginatedResponse(
-        items=[PaginatedItem(id=item.id, title=item.title, description=item.description) for item in items],
+        items=items,
         next_cursor=next_cursor,
         has_more=has_more,
         total=len(_MOCK_ITEMS),
@@ -309,18 +312,30 @@ class ServerTimeResponse(BaseModel):
     formatted: str
 
 
+# Last /demo/time response with the wall-clock second it was built in
+_server_time_cache: tuple[int, ServerTimeResponse] | None = None
+
+
 @router.get("/time", response_model=ServerTimeResponse)
 async def get_server_time():
     """
     Server time endpoint for polling demo.
-    Returns current server timestamp.
+    Returns current server timestamp, rebuilt at most once per second.
     """
-    now = datetime.now(UTC)
-    return ServerTimeResponse(
+    global _server_time_cache
+    now_ns = time.time_ns()
+    second = now_ns // 1_000_000_000
+    if _server_time_cache is not None and _server_time_cache[0] == second:
+        return _server_time_cache[1]
+
+    now = datetime.fromtimestamp(now_ns / 1_000_000_000, UTC)
+    response = ServerTimeResponse(
         timestamp=now.isoformat(),
-        unix_ms=int(now.timestamp() * 1000),
+        unix_ms=now_ns // 1_000_000,
         formatted=now.strftime("%H:%M:%S"),
     )
+    _server_time_cache = (second, response)
+    return response
 
 
 # =============================================================================
@@ -341,6 +356,16 @@ This endpoint demonstrates:
 The frontend parses `data: ` prefixed lines from the response.
 """
 
+# The text is constant, so the SSE events are encoded once at import
+_STREAM_EVENTS = [f"data: {char}\n\n".encode() for char in _MOCK_STREAM_TEXT.strip()]
+_STREAM_DONE = b"data: [DONE]\n\n"
+_STREAM_HEADERS = {
+    "Cache-Control": "no-cache, no-transform",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+    "Transfer-Encoding": "chunked",
+}
+
 
 @router.get("/stream")
 async def stream_demo():
@@ -372,23 +397,14 @@ async def stream_demo():
 
     async def generate():
         # Yield each character with delay for demo
-        for char in _MOCK_STREAM_TEXT.strip():
-            yield f"data: {char}\n\n"
+        for event in _STREAM_EVENTS:
+            yield event
             await asyncio.sleep(0.03)  # 30ms per character (~1000 chars/min)
 
         # Signal completion
-        yield "data: [DONE]\n\n"
-
-    return StreamingResponse(
-        generate(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache, no-transform",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-            "Transfer-Encoding": "chunked",
-        },
-    )
+        yield _STREAM_DONE
+
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=_STREAM_HEADERS)
 
 
 # =============================================================================
@@ -416,6 +432,18 @@ class NewsResponse(BaseModel):
     fetched_at: str
 
 
+# Choices for the mock data sources, built once instead of per request
+_WEATHER_CONDITIONS = ("Sunny", "Cloudy", "Rainy", "Snowy", "Windy")
+_NEWS_HEADLINES = (
+    "Tech stocks surge on AI optimism",
+    "New climate report released",
+    "Central bank holds rates steady",
+    "Startup raises record funding",
+    "Market volatility expected",
+)
+_NEWS_SOURCES = ("Reuters", "Bloomberg", "AP", "BBC", "TechCrunch")
+
+
 @router.get("/weather", response_model=WeatherResponse)
 async def get_weather(
     city: str = Query(default="Moscow"),
@@ -425,11 +453,10 @@ async def get_weather(
     if delay_ms > 0:
         await asyncio.sleep(delay_ms / 1000)
 
-    conditions = ["Sunny", "Cloudy", "Rainy", "Snowy", "Windy"]
     return WeatherResponse(
         city=city,
         temperature=random.randint(-10, 35),
-        condition=random.choice(conditions),
+        condition=random.choice(_WEATHER_CONDITIONS),
         fetched_at=datetime.now(UTC).isoformat(),
     )
 
@@ -457,18 +484,9 @@ async def get_news(delay_ms: int = Query(default=700, ge=0, le=3000)):
     if delay_ms > 0:
         await asyncio.sleep(delay_ms / 1000)
 
-    headlines = [
-        "Tech stocks surge on AI optimism",
-        "New climate report released",
-        "Central bank holds rates steady",
-        "Startup raises record funding",
-        "Market volatility expected",
-    ]
-    sources = ["Reuters", "Bloomberg", "AP", "BBC", "TechCrunch"]
-
     return NewsResponse(
-        headline=random.choice(headlines),
-        source=random.choice(sources),
+        headline=random.choice(_NEWS_HEADLINES),
+        source=random.choice(_NEWS_SOURCES),
         fetched_at=datetime.now(UTC).isoformat(),
     )
 
@@ -484,6 +502,21 @@ class ErrorResponse(BaseModel):
     triggered_at: str
 
 
+_ERROR_MESSAGES = {
+    400: "Bad request - invalid parameters provided",
+    401: "Unauthorized - authentication required",
+    403: "Forbidden - you don't have permission",
+    404: "Not found - resource doesn't exist",
+    409: "Conflict - resource already exists",
+    422: "Validation error - check your input",
+    429: "Rate limited - too many requests",
+    500: "Internal server error - something went wrong",
+    502: "Bad gateway - upstream server error",
+    503: "Service unavailable - try again later",
+    504: "Gateway timeout - upstream server timeout",
+}
+
+
 @router.get("/error/{status_code}")
 async def trigger_error(
     status_code: int,
@@ -499,26 +532,12 @@ async def trigger_error(
     if delay_ms > 0:
         await asyncio.sleep(delay_ms / 1000)
 
-    messages = {
-        400: "Bad request - invalid parameters provided",
-        401: "Unauthorized - authentication required",
-        403: "Forbidden - you don't have permission",
-        404: "Not found - resource doesn't exist",
-        409: "Conflict - resource already exists",
-        422: "Validation error - check your input",
-        429: "Rate limited - too many requests",
-        500: "Internal server error - something went wrong",
-        502: "Bad gateway - upstream server error",
-        503: "Service unavailable - try again later",
-        504: "Gateway timeout - upstream server timeout",
-    }
-
     if status_code < 400 or status_code > 599:
         raise HTTPException(status_code=400, detail="Status code must be 400-599")
 
     raise HTTPException(
         status_code=status_code,
-        detail=messages.get(status_code, f"Error with status {status_code}"),
+        detail=_ERROR_MESSAGES.get(status_code, f"Error with status {status_code}"),
     )
 
 
@@ -570,12 +589,21 @@ ROLE_PERMISSIONS = {
         "manage_roles",
     ],
 }
+# Permission -> roles that hold it, for membership checks
+_PERMISSION_ROLES = {
+    permission: frozenset(role for role, permissions in ROLE_PERMISSIONS.items() if permission in permissions)
+    for permission in {p for permissions in ROLE_PERMISSIONS.values() for p in permissions}
+}
+
+
+async def get_demo_role(user: UserSchema = Depends(get_user)) -> str:
+    """Caller's demo role; FastAPI resolves it once per request for every dependant."""
+    return user.role or "user"
 
 
 @router.get("/rbac/me", response_model=RbacMeResponse)
-async def get_rbac_me(user: UserSchema = Depends(get_user)):
+async def get_rbac_me(role: str = Depends(get_demo_role)):
     """Get your current role and permissions for RBAC demo."""
-    role = user.role or "user"
     permissions = ROLE_PERMISSIONS.get(role, ROLE_PERMISSIONS["user"])
     return RbacMeResponse(role=role, permissions=permissions)
 
@@ -584,6 +612,7 @@ async def get_rbac_me(user: UserSchema = Depends(get_user)):
 async def set_demo_role(
     request: SetRoleRequest,
     user: UserSchema = Depends(get_user),
+    old_role: str = Depends(get_demo_role),
     services: RequestsService = Depends(get_services),
 ):
     """
@@ -592,19 +621,15 @@ async def set_demo_role(
     This allows testing different permission levels without
     needing actual admin access.
     """
-    from core.infrastructure.config import settings
-
     if not settings.debug:
         raise HTTPException(status_code=403, detail="Role switching only available in debug mode")
 
-    valid_roles = ["user", "admin", "owner"]
-    if request.role not in valid_roles:
-        raise HTTPException(status_code=400, detail=f"Invalid role. Must be one of: {valid_roles}")
-
-    old_role = user.role or "user"
+    if request.role not in ROLE_PERMISSIONS:
+        raise HTTPException(status_code=400, detail=f"Invalid role. Must be one of: {list(ROLE_PERMISSIONS)}")
 
-    # Update role in database
+    # Update role in database, then drop the cached session user so the next request sees it
     await services.repo.users.update_user(user.id, {"role": request.role})
+    await services.sessions.invalidate_user_cache(user.id)
 
     return SetRoleResponse(
         success=True,
@@ -615,16 +640,13 @@ async def set_demo_role(
 
 
 @router.post("/rbac/protected-action", response_model=ProtectedActionResponse)
-async def demo_protected_action(user: UserSchema = Depends(get_user)):
+async def demo_protected_action(role: str = Depends(get_demo_role)):
     """
     Demo endpoint that requires owner role.
 
     Use this to test permission checks - only owners can execute this action.
     """
-    role = user.role or "user"
-    permissions = ROLE_PERMISSIONS.get(role, ROLE_PERMISSIONS["user"])
-
-    if "protected_actions" not in permissions:
+    if role not in _PERMISSION_ROLES["protected_actions"]:
         raise HTTPException(
             status_code=403,
             detail=f"This action requires owner role. Your role: {role}",
@@ -1,6 +1,7 @@
 """Socket.IO event handlers for demo."""
 
 import asyncio
+import itertools
 import random
 from collections import deque
 from datetime import UTC, datetime
@@ -26,41 +27,72 @@ FAKE_USERNAMES = [
     "Parker",
 ]
 
+# Simulated activity: counter steps, fake user count drift, and names in shuffled rotation
+SIMULATED_DELTAS = (-3, -2, -1, 1, 2, 3)
+SIMULATED_USER_DRIFT = (-1, 0, 0, 0, 1)
+_fake_username_cycle = itertools.cycle(random.sample(FAKE_USERNAMES, len(FAKE_USERNAMES)))
+
+# Bursts of changes within this window go out as a single "update"
+BROADCAST_INTERVAL = 0.05
+
 # Global demo state
 counter = 0
 fake_users = random.randint(1, 3)
 simulation_task: asyncio.Task | None = None
+broadcast_task: asyncio.Task | None = None
+# Every connected client joins the demo room, so track its size here
+_demo_room_size = 0
 recent_events: deque = deque(maxlen=3)
+# Events queued since the last broadcast, timestamped when it goes out
+pending_events: list[dict] = []
 
 
 def get_demo_user_count() -> int:
     """Get count of users in demo room."""
-    return len(list(sio.manager.get_participants("/", "demo")))
+    return _demo_room_size
 
 
 def create_event(username: str, delta: int) -> dict:
-    """Create an event dict."""
+    """Create an event dict (its time is set when broadcast)."""
     return {
         "user": username,
         "delta": delta,
-        "time": datetime.now(UTC).isoformat(),
     }
 
 
-async def broadcast_state(event: dict | None = None):
+def get_state_payload() -> dict:
+    """Get the current demo state."""
+    return {
+        "counter": counter,
+        "users": fake_users + get_demo_user_count(),
+        "events": list(recent_events),
+    }
+
+
+def queue_broadcast(event: dict) -> None:
+    """Queue event and schedule one state broadcast for the current burst."""
+    global broadcast_task
+    pending_events.append(event)
+
+    if broadcast_task is None:
+        broadcast_task = asyncio.create_task(broadcast_state())
+
+
+async def broadcast_state():
     """Broadcast current state to all connected clients in demo room."""
-    if event:
-        recent_events.append(event)
+    global broadcast_task
+    await asyncio.sleep(BROADCAST_INTERVAL)
+    # Changes made while emitting schedule the next broadcast
+    broadcast_task = None
+
+    now = datetime.now(UTC).isoformat()
+    for event in pending_events:
+        event["time"] = now
+    recent_events.extend(pending_events)
+    pending_events.clear()
 
-    await sio.emit(
-        "update",
-        {
-            "counter": counter,
-            "users": fake_users + get_demo_user_count(),
-            "events": list(recent_events),
-        },
-        room="demo",
-    )
+    # Room emits are encoded once by the manager and sent to all participants concurrently
+    await sio.emit("update", get_state_payload(), room="demo")
 
 
 async def simulate_activity():
@@ -68,38 +100,31 @@ async def simulate_activity():
     global counter, fake_users
     while True:
         await asyncio.sleep(random.uniform(5, 12))
-        delta = random.choice([-3, -2, -1, 1, 2, 3])
+        delta = random.choice(SIMULATED_DELTAS)
         counter += delta
-        fake_users = max(1, min(5, fake_users + random.choice([-1, 0, 0, 0, 1])))
-        event = create_event(random.choice(FAKE_USERNAMES), delta)
-        await broadcast_state(event)
+        fake_users = max(1, min(5, fake_users + random.choice(SIMULATED_USER_DRIFT)))
+        queue_broadcast(create_event(next(_fake_username_cycle), delta))
 
 
 @sio.event
 async def connect(sid, environ, auth=None):
     """Handle new connection."""
-    global simulation_task
+    global simulation_task, _demo_room_size
     await sio.enter_room(sid, "demo")
+    _demo_room_size += 1
 
     if simulation_task is None or simulation_task.done():
         simulation_task = asyncio.create_task(simulate_activity())
 
-    await sio.emit(
-        "update",
-        {
-            "counter": counter,
-            "users": fake_users + get_demo_user_count(),
-            "events": list(recent_events),
-        },
-        to=sid,
-    )
+    await sio.emit("update", get_state_payload(), to=sid)
 
 
 @sio.event
 async def disconnect(sid):
     """Handle disconnection."""
-    global simulation_task
+    global simulation_task, _demo_room_size
     await sio.leave_room(sid, "demo")
+    _demo_room_size = max(0, _demo_room_size - 1)
 
     if get_demo_user_count() == 0 and simulation_task:
         simulation_task.cancel()
@@ -114,5 +139,4 @@ async def increment(sid, delta: int = 1):
     if delta == 0:
         delta = 1
     counter += delta
-    event = create_event("You", delta)
-    await broadcast_state(event)
+    queue_broadcast(create_event("You", delta))
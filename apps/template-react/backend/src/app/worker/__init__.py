@@ -1,3 +1,15 @@
-from app.worker.worker import WorkerSettings
+"""ARQ worker package.
+
+WorkerSettings is resolved lazily, so importing app.worker.jobs (tests, job
+enqueuers) doesn't run worker.py's infrastructure setup.
+"""
 
 __all__ = ["WorkerSettings"]
+
+
+def __getattr__(name: str):
+    if name == "WorkerSettings":
+        from app.worker.worker import WorkerSettings
+
+        return WorkerSettings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
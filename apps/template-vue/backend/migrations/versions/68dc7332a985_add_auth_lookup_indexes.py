@@ -0,0 +1,39 @@
+"""add_auth_lookup_indexes
+
+Revision ID: 68dc7332a985
+Revises: cc1f66a220fd
+Create Date: 2026-10-17 11:42:08.315204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '68dc7332a985'
+down_revision: Union[str, None] = 'cc1f66a220fd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so the users table stays writable on large installs
+    with op.get_context().autocommit_block():
+        # Telegram code login (AuthService) looks users up by tg_username
+        op.create_index(op.f('ix_users_tg_username'), 'users', ['tg_username'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        # Username/password login matches lower(username)
+        op.create_index('ix_users_username_lower', 'users', [sa.text('lower(username)')], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        # Duplicates the index behind the telegram_id UNIQUE constraint, which serves lookups and upserts
+        op.drop_index('ix_users_telegram_id', table_name='users', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_telegram_id', 'users', ['telegram_id'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_users_username_lower', table_name='users', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_users_tg_username'), table_name='users', postgresql_concurrently=True, if_exists=True)
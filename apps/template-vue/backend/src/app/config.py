@@ -74,6 +74,7 @@ class Settings(BaseSettings):
         # Session cookie and Redis key use app name
         object.__setattr__(self.session, "cookie_name", f"{self.app_name}_session")
         object.__setattr__(self.session, "key_prefix", f"{self.app_name}:session:")
+        object.__setattr__(self.session, "user_index_prefix", f"{self.app_name}:user_sessions:")
 
 
 # Singleton instance
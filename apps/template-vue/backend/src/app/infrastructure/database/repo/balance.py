@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+from uuid import UUID
+
+from sqlalchemy import exists, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
+
 from app.infrastructure.database.models.balance import Balance
 from core.infrastructure.database.repo.base import BaseRepo
 
@@ -10,3 +16,31 @@ class BalanceRepo(BaseRepo[Balance]):
     """Repository for Balance model operations."""
 
     model = Balance
+
+    def __init__(self, session):
+        super().__init__(session)
+        self.model_type = Balance
+
+    async def get_or_create(self, user_id: UUID) -> Balance:
+        """Get user balance, inserting a default row if missing, in a single statement.
+
+        INSERT ... ON CONFLICT DO NOTHING RETURNING yields the new row; an existing
+        balance comes from a fallback SELECT in the same query, so there is no write
+        and no second round-trip for returning users.
+        """
+        inserted = (
+            insert(Balance)
+            .values(user_id=user_id)
+            .on_conflict_do_nothing(index_elements=[Balance.user_id])
+            .returning(*Balance.__table__.c)
+            .cte("inserted")
+        )
+        existing = select(*Balance.__table__.c).where(Balance.user_id == user_id, ~exists(inserted.select()))
+
+        balance = aliased(Balance, union_all(select(inserted), existing).subquery())
+        result = await self.session.execute(select(balance).execution_options(populate_existing=True))
+        db_balance = result.scalar_one_or_none()
+        if db_balance is None:
+            # Lost a race with a concurrent insert: its row is newer than this statement's snapshot
+            db_balance = await self.get_by_id(user_id)
+        return db_balance
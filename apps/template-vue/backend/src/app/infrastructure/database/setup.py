@@ -8,10 +8,12 @@ def create_engine(db: DatabaseSettings, echo=False):
         db.url,
         query_cache_size=1200,
         pool_size=20,
-        max_overflow=200,
+        max_overflow=40,  # Bounded burst: pool_size + overflow per process must fit Postgres max_connections
         pool_timeout=30,  # Timeout for getting a connection from the pool
         pool_recycle=1800,  # Recycle connections after 30 minutes
         pool_pre_ping=True,  # Verify connections before using them
+        # asyncpg prepared statements kept per connection (SQLAlchemy default 100): hot ORM queries skip parse/plan
+        connect_args={"prepared_statement_cache_size": 500},
         future=True,
         echo=echo,
     )
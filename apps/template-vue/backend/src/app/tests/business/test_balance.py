@@ -0,0 +1,41 @@
+"""
+Business logic tests for lazily created user balances.
+
+BalanceService.get_or_create_balance resolves the balance in one statement:
+- A user without a balance gets a default row
+- Repeated calls return the same row
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.repo.requests import RequestsRepo
+from app.services.requests import RequestsService
+from core.schemas.users import UserSchema
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.business_logic
+class TestGetOrCreateBalance:
+    """Tests for BalanceService.get_or_create_balance."""
+
+    async def test_creates_missing_balance(self, db_session: AsyncSession):
+        """User without a balance gets a default one."""
+        services = RequestsService(repo=RequestsRepo(db_session))
+        user = await services.users.upsert_by_telegram_id(UserSchema(telegram_id=222222231, username="balance_test_1"))
+
+        balance = await services.balance.get_or_create_balance(user.id)
+
+        assert balance.user_id == user.id
+
+    async def test_returns_existing_balance(self, db_session: AsyncSession):
+        """Second call returns the balance created by the first one."""
+        services = RequestsService(repo=RequestsRepo(db_session))
+        user = await services.users.upsert_by_telegram_id(UserSchema(telegram_id=222222232, username="balance_test_2"))
+
+        created = await services.balance.get_or_create_balance(user.id)
+        again = await services.balance.get_or_create_balance(user.id)
+
+        assert again.user_id == created.user_id
+        assert again.created_at == created.created_at
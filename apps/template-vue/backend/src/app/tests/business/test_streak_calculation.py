@@ -65,6 +65,7 @@ class TestStreakDayCalculation:
         assert calculate_streak_day(moscow_11pm) == date(2025, 8, 30)
 
 
+@pytest.mark.asyncio
 @pytest.mark.business_logic
 class TestStreakUpdate:
     """Tests for streak update logic."""
@@ -180,6 +181,7 @@ class TestStreakUpdate:
         assert updated.current_streak >= 1, "Streak should never be 0"
 
 
+@pytest.mark.asyncio
 @pytest.mark.business_logic
 class TestStreakTimezones:
     """Tests for streak calculation with different timezones."""
@@ -241,6 +243,7 @@ class TestStreakTimezones:
         assert updated is not None
 
 
+@pytest.mark.asyncio
 @pytest.mark.business_logic
 class TestStreakReset:
     """Tests for streak reset functionality."""
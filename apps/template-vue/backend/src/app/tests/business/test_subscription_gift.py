@@ -0,0 +1,107 @@
+"""
+Business logic tests for gifting subscription days.
+
+SubscriptionsService.gift_or_extend resolves the subscription in one statement:
+- A live subscription is extended by the gifted days
+- A user without one gets a new GIFT_SUB subscription
+- A CANCELED but not yet ended subscription is extended and reactivated
+- With several live subscriptions only the latest-ending one is extended
+"""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.repo.requests import RequestsRepo
+from app.services.requests import RequestsService
+from core.infrastructure.database.models.enums import PaymentProvider, SubscriptionStatus
+from core.schemas.users import UserSchema
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create_user(services: RequestsService, telegram_id: int) -> UUID:
+    user = await services.users.upsert_by_telegram_id(
+        UserSchema(telegram_id=telegram_id, username=f"gift_test_{telegram_id}")
+    )
+    return user.id
+
+
+async def _create_subscription(
+    services: RequestsService, user_id: UUID, end_date: datetime, status: SubscriptionStatus
+):
+    return await services.repo.subscriptions.create(
+        {
+            "id": uuid4(),
+            "user_id": user_id,
+            "product_id": "WEEK_SUB_V2",
+            "provider_id": PaymentProvider.GIFT,
+            "status": status,
+            "currency": "RUB",
+            "start_date": datetime.now(UTC),
+            "end_date": end_date,
+        }
+    )
+
+
+@pytest.mark.business_logic
+class TestGiftOrExtend:
+    """Tests for SubscriptionsService.gift_or_extend."""
+
+    async def test_extends_live_subscription(self, db_session: AsyncSession):
+        """Active subscription gets the gifted days added to its end date."""
+        services = RequestsService(repo=RequestsRepo(db_session))
+        user_id = await _create_user(services, 222222241)
+        end_date = datetime.now(UTC) + timedelta(days=5)
+        existing = await _create_subscription(services, user_id, end_date, SubscriptionStatus.ACTIVE)
+
+        gifted = await services.subscriptions.gift_or_extend(user_id, 3, gifted_by=user_id)
+
+        assert gifted.id == existing.id
+        assert gifted.end_date == end_date + timedelta(days=3)
+        assert len(await services.repo.subscriptions.get_by_user_id(user_id)) == 1
+
+    async def test_creates_gift_subscription(self, db_session: AsyncSession):
+        """User without a live subscription gets a new GIFT_SUB one starting now."""
+        services = RequestsService(repo=RequestsRepo(db_session))
+        user_id = await _create_user(services, 222222242)
+        before = datetime.now(UTC)
+
+        gifted = await services.subscriptions.gift_or_extend(user_id, 3, gifted_by=user_id)
+
+        assert gifted.product_id == "GIFT_SUB"
+        assert gifted.status == SubscriptionStatus.ACTIVE
+        assert gifted.end_date - gifted.start_date == timedelta(days=3)
+        assert gifted.start_date >= before
+        assert len(await services.repo.subscriptions.get_by_user_id(user_id)) == 1
+
+    async def test_reactivates_canceled_subscription(self, db_session: AsyncSession):
+        """CANCELED subscription that hasn't ended is extended and becomes ACTIVE again."""
+        services = RequestsService(repo=RequestsRepo(db_session))
+        user_id = await _create_user(services, 222222243)
+        end_date = datetime.now(UTC) + timedelta(days=2)
+        existing = await _create_subscription(services, user_id, end_date, SubscriptionStatus.CANCELED)
+
+        gifted = await services.subscriptions.gift_or_extend(user_id, 3, gifted_by=user_id)
+
+        assert gifted.id == existing.id
+        assert gifted.status == SubscriptionStatus.ACTIVE
+        assert gifted.end_date == end_date + timedelta(days=3)
+
+    async def test_extends_only_latest_of_several_live_subscriptions(self, db_session: AsyncSession):
+        """Two live subscriptions: the later-ending one is extended, the other is untouched."""
+        services = RequestsService(repo=RequestsRepo(db_session))
+        user_id = await _create_user(services, 222222244)
+        now = datetime.now(UTC)
+        earlier = await _create_subscription(services, user_id, now + timedelta(days=2), SubscriptionStatus.ACTIVE)
+        later = await _create_subscription(services, user_id, now + timedelta(days=10), SubscriptionStatus.ACTIVE)
+
+        gifted = await services.subscriptions.gift_or_extend(user_id, 3, gifted_by=user_id)
+
+        assert gifted.id == later.id
+        assert gifted.end_date == now + timedelta(days=13)
+        await db_session.refresh(earlier)
+        assert earlier.end_date == now + timedelta(days=2)
+        assert len(await services.repo.subscriptions.get_by_user_id(user_id)) == 2
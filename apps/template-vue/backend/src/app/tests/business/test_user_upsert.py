@@ -0,0 +1,61 @@
+"""
+Business logic tests for the Telegram user upsert used by webapp auth.
+
+Every Mini App request resolves its user through a single upsert keyed on telegram_id:
+- New users are inserted with their app profile
+- Changed TG fields are refreshed, app profile fields are kept
+- Unchanged users are returned without a write
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.repo.requests import RequestsRepo
+from app.services.requests import RequestsService
+from core.schemas.users import UserSchema
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.business_logic
+class TestUpsertByTelegramId:
+    """Tests for UserService.upsert_by_telegram_id."""
+
+    async def test_creates_new_user(self, db_session: AsyncSession):
+        """Unknown telegram_id creates a user with profile and TG fields."""
+        services = RequestsService(repo=RequestsRepo(db_session))
+
+        user = await services.users.upsert_by_telegram_id(
+            UserSchema(telegram_id=222222221, display_name="Ann", username="upsert_test_1", tg_first_name="Ann")
+        )
+
+        assert user.id is not None
+        assert user.telegram_id == 222222221
+        assert user.display_name == "Ann"
+        assert user.tg_first_name == "Ann"
+
+    async def test_repeated_login_returns_same_user(self, db_session: AsyncSession):
+        """Repeated login with the same TG data returns the existing row."""
+        services = RequestsService(repo=RequestsRepo(db_session))
+        data = UserSchema(telegram_id=222222222, username="upsert_test_2", tg_first_name="Bob")
+
+        created = await services.users.upsert_by_telegram_id(data)
+        again = await services.users.upsert_by_telegram_id(data)
+
+        assert again.id == created.id
+        assert again.tg_first_name == "Bob"
+
+    async def test_changed_tg_fields_are_refreshed(self, db_session: AsyncSession):
+        """Changed TG fields are updated, app profile from first login is kept."""
+        services = RequestsService(repo=RequestsRepo(db_session))
+
+        created = await services.users.upsert_by_telegram_id(
+            UserSchema(telegram_id=222222223, display_name="Carl", username="upsert_test_3", tg_first_name="Carl")
+        )
+        updated = await services.users.upsert_by_telegram_id(
+            UserSchema(telegram_id=222222223, display_name="Karl", username="upsert_test_3", tg_first_name="Karl")
+        )
+
+        assert updated.id == created.id
+        assert updated.tg_first_name == "Karl"
+        assert updated.display_name == "Carl"
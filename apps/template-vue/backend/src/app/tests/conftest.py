@@ -1,5 +1,7 @@
 """Pytest configuration for template backend tests."""
 
+import json
+import os
 import random
 from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -22,10 +24,9 @@ with patch("core.infrastructure.redis.RedisClient.__init__", lambda self, config
     from app.webhook.app import app
     from app.webhook.dependencies.arq import get_arq_pool
     from app.webhook.dependencies.bot import get_bot
-    from app.webhook.dependencies.database import get_repo
+    from app.webhook.dependencies.database import get_repo, get_repo_ro
     from app.webhook.dependencies.rabbit import get_rabbit_producer
     from app.webhook.dependencies.redis import get_redis_client
-    from app.webhook.routers.demo import _counters
     from core.infrastructure.config import settings
     from core.testing.fixtures.auth import generate_telegram_init_data
 
@@ -60,41 +61,72 @@ __all__ = [
 ]
 
 
+async def override_get_bot():
+    yield MagicMock(id=123456789, username="test_bot")
+
+
+async def override_get_arq():
+    mock_arq = MagicMock()
+    mock_arq.enqueue_job = AsyncMock(return_value=MagicMock())
+    yield mock_arq
+
+
+async def override_get_rabbit():
+    yield MagicMock()
+
+
+# Overrides that don't depend on per-test fixtures, installed by test_app alongside repo/redis
+STATIC_OVERRIDES = {
+    get_bot: override_get_bot,
+    get_arq_pool: override_get_arq,
+    get_rabbit_producer: override_get_rabbit,
+}
+
+
+# Opt-in progressive results for CI dashboards: one JSON line per finished test
+RESULTS_FILE = os.environ.get("PYTEST_RESULTS_FILE")
+
+
+def pytest_runtest_logreport(report):
+    """Append each test outcome to RESULTS_FILE as soon as it is known."""
+    # xdist forwards worker reports to the controller, which writes them alone - no locking needed
+    if not RESULTS_FILE or os.environ.get("PYTEST_XDIST_WORKER"):
+        return
+    # Setup/teardown only matter when they fail or skip the test
+    if report.when != "call" and report.passed:
+        return
+
+    line = json.dumps(
+        {"nodeid": report.nodeid, "when": report.when, "outcome": report.outcome, "duration": report.duration}
+    )
+    with open(RESULTS_FILE, "a") as f:
+        f.write(line + "\n")
+
+
 @pytest_asyncio.fixture
 async def test_app(db_session: AsyncSession, mock_redis: InMemoryRedis):
     """Template app with test dependencies injected."""
     original_overrides = app.dependency_overrides.copy()
     original_session_redis = auth_module.session_redis
 
-    # Override dependencies
+    # Override dependencies bound to this test's db session and redis
     async def override_get_repo():
         yield RequestsRepo(db_session)
 
     async def override_get_redis():
         yield mock_redis
 
-    async def override_get_bot():
-        yield MagicMock(id=123456789, username="test_bot")
-
-    async def override_get_arq():
-        mock_arq = MagicMock()
-        mock_arq.enqueue_job = AsyncMock(return_value=MagicMock())
-        yield mock_arq
-
-    async def override_get_rabbit():
-        yield MagicMock()
-
+    app.dependency_overrides.update(STATIC_OVERRIDES)
     app.dependency_overrides[get_repo] = override_get_repo
+    app.dependency_overrides[get_repo_ro] = override_get_repo
     app.dependency_overrides[get_redis_client] = override_get_redis
-    app.dependency_overrides[get_bot] = override_get_bot
-    app.dependency_overrides[get_arq_pool] = override_get_arq
-    app.dependency_overrides[get_rabbit_producer] = override_get_rabbit
     auth_module.session_redis = mock_redis
 
     yield app
 
     # Cleanup
-    app.dependency_overrides = original_overrides
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(original_overrides)
     auth_module.session_redis = original_session_redis
 
 
@@ -138,14 +170,6 @@ async def test_user(authenticated_client: AsyncClient):
     return UserSchema(**response.json())
 
 
-@pytest_asyncio.fixture(autouse=True)
-async def reset_demo_counters():
-    """Reset all demo counters before each test to ensure isolation."""
-    _counters.clear()
-    yield
-    _counters.clear()
-
-
 # =============================================================================
 # Architecture Contract Test Fixtures
 # =============================================================================
@@ -30,6 +30,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database.repo.requests import RequestsRepo
 
+pytestmark = pytest.mark.asyncio
+
 
 @pytest.mark.business_logic
 async def test_get_or_create_user_is_idempotent(db_session: AsyncSession):
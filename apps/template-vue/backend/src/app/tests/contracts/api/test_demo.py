@@ -12,6 +12,8 @@ import uuid
 import pytest
 from httpx import AsyncClient
 
+pytestmark = pytest.mark.asyncio
+
 
 def unique_counter_id() -> str:
     """Generate unique counter ID for test isolation."""
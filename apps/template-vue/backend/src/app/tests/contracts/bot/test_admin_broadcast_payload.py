@@ -0,0 +1,62 @@
+"""
+Contract tests for the /broadcast job payload.
+
+Tests cover:
+- Only fields read by user_broadcast_job are queued
+- Formatted variants replace plain ones
+"""
+
+import pytest
+
+from app.tgbot.handlers.admin import _build_broadcast_payload
+
+
+@pytest.mark.contract
+class TestBuildBroadcastPayload:
+    """Tests for the payload queued by confirm_broadcast."""
+
+    def test_plain_text_payload(self):
+        """Plain text keeps only the raw message text."""
+        data = {"message_type": "text", "message_text": "Hello", "has_formatting": False, "keyboard_type": "none"}
+
+        assert _build_broadcast_payload(data) == {
+            "message_type": "text",
+            "keyboard_type": "none",
+            "message_text": "Hello",
+        }
+
+    def test_formatted_text_drops_raw_text(self):
+        """Formatted text sends the HTML variant only."""
+        data = {
+            "message_type": "text",
+            "message_text": "Hello",
+            "message_html": "<b>Hello</b>",
+            "has_formatting": True,
+            "keyboard_type": "main",
+        }
+
+        assert _build_broadcast_payload(data) == {
+            "message_type": "text",
+            "keyboard_type": "main",
+            "has_formatting": True,
+            "message_html": "<b>Hello</b>",
+        }
+
+    def test_photo_payload_drops_unrelated_fields(self):
+        """Photo payload keeps file id and caption, nothing else from FSM state."""
+        data = {
+            "message_type": "photo",
+            "photo_file_id": "file-123",
+            "caption": "Look",
+            "caption_html": None,
+            "has_caption_formatting": False,
+            "keyboard_type": "daily",
+            "unrelated": "value",
+        }
+
+        assert _build_broadcast_payload(data) == {
+            "message_type": "photo",
+            "keyboard_type": "daily",
+            "photo_file_id": "file-123",
+            "caption": "Look",
+        }
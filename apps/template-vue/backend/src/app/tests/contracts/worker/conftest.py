@@ -11,14 +11,18 @@ from app.infrastructure.database.repo.requests import RequestsRepo
 from app.services.requests import RequestsService
 from core.testing.fixtures.worker import MockBot, create_worker_context
 
+# One bot for the whole module, reset before each test instead of rebuilt
+_shared_bot = MockBot()
+
 
 @pytest_asyncio.fixture
 async def mock_bot():
     """Mock bot that captures messages for worker tests.
 
-    Returns MockBot instance from core's worker fixtures.
+    Returns the shared MockBot from core's worker fixtures with nothing captured.
     """
-    return MockBot()
+    _shared_bot.clear()
+    return _shared_bot
 
 
 @pytest_asyncio.fixture
@@ -5,43 +5,44 @@ Tests the actual job logic with real database and captured messages.
 """
 
 import pytest
+import pytest_asyncio
+from sqlalchemy.dialects.postgresql import insert
 
 from app.worker.jobs import send_delayed_notification
+from core.infrastructure.database.models import User
+
+pytestmark = pytest.mark.asyncio
+
+NOTIFIED_TELEGRAM_ID = 12345
+
+
+@pytest_asyncio.fixture
+async def notified_user(worker_ctx):
+    """User the notification is addressed to, seeded with a single INSERT."""
+    async with worker_ctx.session_pool() as session:
+        await session.execute(
+            insert(User)
+            .values(telegram_id=NOTIFIED_TELEGRAM_ID, username="notif_user", tg_first_name="Notif")
+            .on_conflict_do_nothing(index_elements=[User.telegram_id])
+        )
+        await session.commit()
+    return NOTIFIED_TELEGRAM_ID
 
 
 @pytest.mark.contract
 class TestDelayedNotificationJob:
     """Tests for delayed notification job."""
 
-    async def test_sends_notification_to_user(self, worker_ctx, mock_bot):
+    async def test_sends_notification_to_user(self, worker_ctx, mock_bot, notified_user):
         """Job sends notification to specified telegram user."""
-        # Create user via worker's transaction
-        async with worker_ctx.with_transaction() as services:
-            await services.repo.users.get_or_create_user(
-                {
-                    "telegram_id": 12345,
-                    "username": "notif_user",
-                    "tg_first_name": "Notif",
-                }
-            )
-
-        await send_delayed_notification(worker_ctx.ctx_dict, 12345, 5)
+        await send_delayed_notification(worker_ctx.ctx_dict, notified_user, 5)
 
         assert len(mock_bot.messages) == 1
-        assert mock_bot.messages[0].chat_id == 12345
+        assert mock_bot.messages[0].chat_id == notified_user
 
-    async def test_includes_delay_in_message(self, worker_ctx, mock_bot):
+    async def test_includes_delay_in_message(self, worker_ctx, mock_bot, notified_user):
         """Job includes delay seconds in message."""
-        async with worker_ctx.with_transaction() as services:
-            await services.repo.users.get_or_create_user(
-                {
-                    "telegram_id": 23456,
-                    "username": "delay_user",
-                    "tg_first_name": "Delay",
-                }
-            )
-
-        await send_delayed_notification(worker_ctx.ctx_dict, 23456, 10)
+        await send_delayed_notification(worker_ctx.ctx_dict, notified_user, 10)
 
         # Message should reference the delay
         msg = mock_bot.messages[0]
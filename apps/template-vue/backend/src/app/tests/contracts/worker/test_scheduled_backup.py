@@ -0,0 +1,83 @@
+"""
+Contract tests for scheduled_backup_job.
+
+pg_dump is replaced by a fake create_backup that writes a small file; the
+upload and file_id fan-out are checked through the captured bot documents.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from aiogram.types import BufferedInputFile
+
+from core.infrastructure.arq.jobs import backup as backup_jobs
+from core.infrastructure.arq.jobs import scheduled_backup_job
+from core.infrastructure.config import settings
+from core.scripts.common.backup_database import BackupResult
+from core.testing.fixtures.worker import FailingBot
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def fake_backup(tmp_path, monkeypatch):
+    """Replace pg_dump with a backup file written to tmp_path."""
+    backup_file = tmp_path / "backup.sql.gz"
+    backup_file.write_bytes(b"backup")
+
+    async def create_backup(**kwargs):
+        return BackupResult(
+            success=True,
+            file_path=str(backup_file),
+            size_bytes=backup_file.stat().st_size,
+            duration_seconds=0.1,
+            tables_count=3,
+            timestamp=datetime.now(UTC),
+            compressed=True,
+            app_name=settings.app_name,
+        )
+
+    monkeypatch.setattr(backup_jobs, "create_backup", create_backup)
+    return backup_file
+
+
+@pytest.mark.contract
+class TestScheduledBackupJob:
+    """Tests for scheduled backup job."""
+
+    async def test_uploads_once_and_resends_file_id(self, worker_ctx, mock_bot, fake_backup, monkeypatch):
+        """First owner gets the upload, the rest get its file_id."""
+        monkeypatch.setattr(settings.rbac, "owner_ids", [111, 222, 333])
+
+        result = await scheduled_backup_job(worker_ctx.ctx_dict)
+
+        assert result["success"] is True
+        upload, *resends = mock_bot.documents
+        assert upload.chat_id == 111
+        assert isinstance(upload.document, BufferedInputFile)
+        assert {d.chat_id for d in resends} == {222, 333}
+        assert {d.document for d in resends} == {"document_1"}
+
+    async def test_next_owner_uploads_when_first_fails(self, worker_ctx, fake_backup, monkeypatch):
+        """A failed upload to the first owner moves the upload to the next one."""
+        bot = FailingBot({111})
+        worker_ctx.ctx_dict["bot"] = bot
+        monkeypatch.setattr(settings.rbac, "owner_ids", [111, 222, 333])
+
+        result = await scheduled_backup_job(worker_ctx.ctx_dict)
+
+        assert result["success"] is True
+        upload, resend = bot.documents
+        assert upload.chat_id == 222
+        assert isinstance(upload.document, BufferedInputFile)
+        assert resend.chat_id == 333
+        assert resend.document == "document_1"
+
+    async def test_handles_empty_owner_list(self, worker_ctx, mock_bot, fake_backup, monkeypatch):
+        """Job succeeds without sending anything when there are no owners."""
+        monkeypatch.setattr(settings.rbac, "owner_ids", [])
+
+        result = await scheduled_backup_job(worker_ctx.ctx_dict)
+
+        assert result["success"] is True
+        assert mock_bot.documents == []
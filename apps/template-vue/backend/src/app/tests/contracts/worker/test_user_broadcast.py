@@ -8,6 +8,8 @@ import pytest
 
 from app.worker.jobs import user_broadcast_job
 
+pytestmark = pytest.mark.asyncio
+
 
 @pytest.mark.contract
 class TestUserBroadcastJob:
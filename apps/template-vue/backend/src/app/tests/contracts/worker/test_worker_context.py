@@ -0,0 +1,52 @@
+"""
+Contract tests for WorkerContext.with_connection.
+
+Statements run on a raw engine connection; the block commits on success
+and rolls back on exception.
+"""
+
+import pytest
+from sqlalchemy import update
+
+from core.infrastructure.database.models.users import User
+from core.schemas.users import UserSchema
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create_user(worker_ctx, telegram_id: int):
+    async with worker_ctx.with_transaction() as services:
+        return await services.users.upsert_by_telegram_id(
+            UserSchema(telegram_id=telegram_id, username=f"conn_test_{telegram_id}")
+        )
+
+
+async def _get_username(worker_ctx, user_id) -> str:
+    async with worker_ctx.with_repo() as repo:
+        return (await repo.users.get_user_by_id(user_id)).username
+
+
+@pytest.mark.contract
+class TestWorkerContextWithConnection:
+    """Tests for WorkerContext.with_connection."""
+
+    async def test_commits_statement(self, worker_ctx):
+        """A statement run through with_connection is visible to later sessions."""
+        user = await _create_user(worker_ctx, 333333301)
+
+        async with worker_ctx.with_connection() as conn:
+            result = await conn.execute(update(User).where(User.id == user.id).values(username="renamed"))
+
+        assert result.rowcount == 1
+        assert await _get_username(worker_ctx, user.id) == "renamed"
+
+    async def test_rolls_back_on_exception(self, worker_ctx):
+        """An exception inside the block discards the statement."""
+        user = await _create_user(worker_ctx, 333333302)
+
+        with pytest.raises(RuntimeError):
+            async with worker_ctx.with_connection() as conn:
+                await conn.execute(update(User).where(User.id == user.id).values(username="renamed"))
+                raise RuntimeError("job failed")
+
+        assert await _get_username(worker_ctx, user.id) == "conn_test_333333302"
@@ -13,6 +13,8 @@ admin notifications does not recur.
 import pytest
 from httpx import AsyncClient
 
+pytestmark = pytest.mark.asyncio
+
 
 @pytest.mark.regression
 class TestIsNewAdminSpamFix:
@@ -23,6 +23,7 @@ from app.services.requests import RequestsService
 class TestProtocolMigrationRegression:
     """Regression tests for Protocol-based dependency injection pattern."""
 
+    @pytest.mark.asyncio
     async def test_requests_service_injects_app_products(self, db_session):
         """
         RequestsService injects app-specific products to core services.
@@ -85,6 +86,7 @@ class TestProtocolMigrationRegression:
         # Core should use injected products
         assert "self.products" in source, "SubscriptionsService should use self.products (injected via Protocol)."
 
+    @pytest.mark.asyncio
     async def test_products_api_endpoint_works_with_protocol(self, authenticated_client):
         """
         GET /payments/products works with Protocol-injected products.
@@ -111,6 +113,7 @@ class TestProtocolMigrationRegression:
             assert "price" in product, "Product missing 'price' field"
             assert "duration_days" in product, "Product missing 'duration_days' field"
 
+    @pytest.mark.asyncio
     async def test_subscription_service_uses_injected_products(self, authenticated_client):
         """
         Subscription endpoint works with Protocol-injected products.
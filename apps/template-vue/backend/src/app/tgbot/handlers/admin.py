@@ -1,6 +1,10 @@
+import asyncio
+import html
+import json
+import re
 from datetime import UTC, datetime, timedelta
 
-from aiogram import F, Router, types
+from aiogram import F, Router, exceptions, types
 from aiogram.filters import Command, CommandObject
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
@@ -19,6 +23,43 @@ from core.schemas.users import UpdateUserRequest, UserSchema
 router = Router()
 logger = get_logger(__name__)
 
+# Rendered /promo_list pages (JSON list of HTML), dropped whenever a broadcast is scheduled or cancelled
+PROMO_LIST_CACHE_KEY = f"{settings.app_name}:promo_list:html"
+PROMO_LIST_CACHE_TTL = 30  # seconds
+# Broadcasts per /promo_list message; keeps every page well under Telegram's 4096-char limit
+PROMO_LIST_PAGE_SIZE = 10
+
+# /giftsub <telegram_id> <duration> and /promo_cancel <broadcast_id> argument grammars
+_GIFTSUB_RE = re.compile(r"(\d+)\s+(week|month|year|max)")
+_BROADCAST_ID_RE = re.compile(r"\d+")
+_DUR_DAYS = {"week": 7, "month": 30, "year": 365, "max": 365 * 5}
+
+# Promo time-slot choice -> (slot enum, emoji, display name)
+_SLOT_TABLE = {
+    "morning": (NotificationTimeSlot.MORNING, "🌅", "Morning"),
+    "evening": (NotificationTimeSlot.EVENING, "🌙", "Evening"),
+}
+_SLOT_SUMMARY_TEXT = {
+    "morning": "🌅 Morning (10 AM)",
+    "evening": "🌙 Evening (7 PM)",
+    "both": "🔄 Both Morning & Evening",
+}
+
+_SINGLE_PROMO_SCHEDULED_TMPL = (
+    "✅ <b>Promotional broadcast scheduled successfully!</b>\n\n"
+    "{emoji} Broadcast ID: #{id}\n"
+    "📅 Time Slot: {name}\n"
+    "🔢 Will run for {repeat_count} days\n\n"
+    "It will start being sent during the next {name_lower} notification cycle."
+)
+_BOTH_PROMOS_SCHEDULED_TMPL = (
+    "✅ <b>Promotional broadcasts scheduled successfully!</b>\n\n"
+    "🌅 Morning Broadcast ID: #{morning_id}\n"
+    "🌙 Evening Broadcast ID: #{evening_id}\n"
+    "🔢 Each will run for {repeat_count} days\n\n"
+    "They will start being sent during the next notification cycles."
+)
+
 
 async def _process_media_message(state: FSMContext, media_type: str, file_id: str, message: types.Message):
     """Helper function to process media messages (photo, video, animation, document)"""
@@ -59,6 +100,28 @@ async def _process_media_message(state: FSMContext, media_type: str, file_id: st
     )
 
 
+def _build_broadcast_payload(data: dict) -> dict:
+    """Select only the FSM fields that user_broadcast_job reads.
+
+    FSM data accumulates every update_data() call of the flow, so it is not
+    forwarded to the queue as-is. The formatted variant replaces the plain one.
+    """
+    payload = {"message_type": data["message_type"], "keyboard_type": data.get("keyboard_type")}
+
+    if data["message_type"] == "photo":
+        payload["photo_file_id"] = data["photo_file_id"]
+        if data.get("has_caption_formatting"):
+            payload.update(has_caption_formatting=True, caption_html=data.get("caption_html"))
+        else:
+            payload["caption"] = data.get("caption", "")
+    elif data.get("has_formatting"):
+        payload.update(has_formatting=True, message_html=data["message_html"])
+    else:
+        payload["message_text"] = data.get("message_text", "")
+
+    return payload
+
+
 # Define states for broadcast flow
 class BroadcastStates(StatesGroup):
     waiting_for_message = State()
@@ -76,40 +139,45 @@ class PromoStates(StatesGroup):
     confirmation = State()
 
 
+_ADMIN_COMMANDS_TEXT = (
+    "🔧 Admin Commands\n\n"
+    "Broadcasting:\n"
+    "• /broadcast - Send message to all users\n"
+    "• /promo - Schedule promotional broadcasts\n"
+    "• /promo\\_list - View active promotional broadcasts\n"
+    "• /promo\\_cancel <id> - Cancel promotional broadcast\n\n"
+    "User Management:\n"
+    "• /giftsub <user\\_id> <week|month|year|max> - Gift subscription to user\n\n"
+    "Statistics:\n"
+    "• /stats - Generate and send daily statistics manually\n\n"
+    "Special:\n"
+    "• /keygo\\_prediction - Send keygo prediction message\n\n"
+    "This Menu:\n"
+    "• /admin - Show this admin commands list"
+)
+
+
+async def _require_admin(user: UserSchema, message: types.Message) -> bool:
+    """Check the user is a configured owner, replying with a permission error if not."""
+    if user.telegram_id and user.telegram_id in settings.rbac.owner_ids_set:
+        return True
+    await message.answer("You don't have permission to use this command")
+    return False
+
+
 @router.message(Command("admin"))
 async def admin_command(message: types.Message, user: UserSchema):
     """Handler for /admin command. Shows all available admin commands."""
-    # Check if user is admin
-    if not user.telegram_id or user.telegram_id not in settings.rbac.owner_ids:
-        await message.answer("You don't have permission to use this command")
+    if not await _require_admin(user, message):
         return
 
-    admin_commands = (
-        "🔧 Admin Commands\n\n"
-        "Broadcasting:\n"
-        "• /broadcast - Send message to all users\n"
-        "• /promo - Schedule promotional broadcasts\n"
-        "• /promo\\_list - View active promotional broadcasts\n"
-        "• /promo\\_cancel <id> - Cancel promotional broadcast\n\n"
-        "User Management:\n"
-        "• /giftsub <user\\_id> <week|month|year|max> - Gift subscription to user\n\n"
-        "Statistics:\n"
-        "• /stats - Generate and send daily statistics manually\n\n"
-        "Special:\n"
-        "• /keygo\\_prediction - Send keygo prediction message\n\n"
-        "This Menu:\n"
-        "• /admin - Show this admin commands list"
-    )
-
-    await message.answer(admin_commands, parse_mode="Markdown")
+    await message.answer(_ADMIN_COMMANDS_TEXT, parse_mode="Markdown")
 
 
 @router.message(Command("broadcast"))
 async def broadcast_command(message: types.Message, state: FSMContext, user: UserSchema):
     """Handler for /broadcast command. Initiates the broadcast flow."""
-    # Check if user is admin
-    if not user.telegram_id or user.telegram_id not in settings.rbac.owner_ids:
-        await message.answer("You don't have permission to use this command")
+    if not await _require_admin(user, message):
         return
 
     await message.answer("Please forward the message you want to broadcast to all users.")
@@ -326,7 +394,7 @@ async def confirm_broadcast(callback: types.CallbackQuery, state: FSMContext, se
     try:
         await services.worker.enqueue_job(
             "user_broadcast_job",
-            broadcast_data=data,
+            broadcast_data=_build_broadcast_payload(data),
             requester_telegram_id=callback.from_user.id,
         )
 
@@ -349,9 +417,7 @@ async def confirm_broadcast(callback: types.CallbackQuery, state: FSMContext, se
 @router.message(Command("keygo_prediction"))
 async def keygo_prediction_command(message: types.Message, user: UserSchema):
     """Handler for /keygo_prediction command. Sends a prediction message with keygo image."""
-    # Check if user is admin
-    if not user.telegram_id or user.telegram_id not in settings.rbac.owner_ids:
-        await message.answer("You don't have permission to use this command")
+    if not await _require_admin(user, message):
         return
 
     # Get the keygo keyboard
@@ -369,9 +435,7 @@ async def keygo_prediction_command(message: types.Message, user: UserSchema):
 @router.message(Command("stats"))
 async def stats_command(message: types.Message, user: UserSchema, services: RequestsService):
     """Handler for /stats command. Manually triggers daily statistics generation and broadcast."""
-    # Check if user is admin
-    if not user.telegram_id or user.telegram_id not in settings.rbac.owner_ids:
-        await message.answer("You don't have permission to use this command")
+    if not await _require_admin(user, message):
         return
 
     try:
@@ -404,9 +468,7 @@ async def stats_command(message: types.Message, user: UserSchema, services: Requ
 @router.message(Command("promo"))
 async def promo_command(message: types.Message, state: FSMContext, user: UserSchema):
     """Handler for /promo command. Initiates the promotional broadcast scheduling flow."""
-    # Check if user is admin
-    if not user.telegram_id or user.telegram_id not in settings.rbac.owner_ids:
-        await message.answer("You don't have permission to use this command")
+    if not await _require_admin(user, message):
         return
 
     await message.answer(
@@ -650,11 +712,7 @@ async def _show_promo_preview_and_confirmation(message_or_callback, state: FSMCo
             )
 
     # Show summary and confirmation
-    time_slot_text = {
-        "morning": "🌅 Morning (10 AM)",
-        "evening": "🌙 Evening (7 PM)",
-        "both": "🔄 Both Morning & Evening",
-    }[data["time_slot"]]
+    time_slot_text = _SLOT_SUMMARY_TEXT[data["time_slot"]]
 
     keyboard_display = keyboard_type.title()
     if keyboard_type == "main" and data.get("keyboard_button_text"):
@@ -745,87 +803,117 @@ async def confirm_promo(callback: types.CallbackQuery, state: FSMContext, servic
             evening_data = broadcast_data.copy()
             evening_data["time_slot"] = NotificationTimeSlot.EVENING
 
-            morning_broadcast = await services.repo.promotional_broadcasts.create(morning_data)
-            evening_broadcast = await services.repo.promotional_broadcasts.create(evening_data)
+            morning_broadcast, evening_broadcast = await services.repo.promotional_broadcasts.bulk_create(
+                [morning_data, evening_data]
+            )
 
             await callback.message.answer(
-                f"✅ **Promotional broadcasts scheduled successfully!**\n\n"
-                f"🌅 Morning Broadcast ID: #{morning_broadcast.id}\n"
-                f"🌙 Evening Broadcast ID: #{evening_broadcast.id}\n"
-                f"🔢 Each will run for {data['repeat_count']} days\n\n"
-                f"They will start being sent during the next notification cycles.",
-                parse_mode="Markdown",
+                _BOTH_PROMOS_SCHEDULED_TMPL.format(
+                    morning_id=morning_broadcast.id,
+                    evening_id=evening_broadcast.id,
+                    repeat_count=data["repeat_count"],
+                ),
+                parse_mode="HTML",
             )
         else:
             # Create single broadcast
-            time_slot = NotificationTimeSlot.MORNING if data["time_slot"] == "morning" else NotificationTimeSlot.EVENING
-            broadcast_data["time_slot"] = time_slot
+            slot_enum, slot_emoji, slot_name = _SLOT_TABLE[data["time_slot"]]
+            broadcast_data["time_slot"] = slot_enum
 
             broadcast = await services.repo.promotional_broadcasts.create(broadcast_data)
 
-            slot_emoji = "🌅" if data["time_slot"] == "morning" else "🌙"
-            slot_name = data["time_slot"].title()
-
             await callback.message.answer(
-                f"✅ **Promotional broadcast scheduled successfully!**\n\n"
-                f"{slot_emoji} Broadcast ID: #{broadcast.id}\n"
-                f"📅 Time Slot: {slot_name}\n"
-                f"🔢 Will run for {data['repeat_count']} days\n\n"
-                f"It will start being sent during the next {slot_name.lower()} notification cycle.",
-                parse_mode="Markdown",
+                _SINGLE_PROMO_SCHEDULED_TMPL.format(
+                    emoji=slot_emoji,
+                    id=broadcast.id,
+                    name=slot_name,
+                    name_lower=slot_name.lower(),
+                    repeat_count=data["repeat_count"],
+                ),
+                parse_mode="HTML",
             )
 
+        await services.redis.delete(PROMO_LIST_CACHE_KEY)
+
     except Exception as e:
         logger.error(f"Failed to create promotional broadcast: {e}")
         await callback.message.answer(
-            "❌ **Error scheduling promotional broadcast.**\n\nPlease try again later or check the logs for details.",
-            parse_mode="Markdown",
+            "❌ <b>Error scheduling promotional broadcast.</b>\n\nPlease try again later or check the logs for details.",
+            parse_mode="HTML",
         )
 
     await state.clear()
 
 
+async def _answer_with_retry(message: types.Message, text: str, **kwargs) -> None:
+    """Reply, waiting out one Telegram flood-control RetryAfter before retrying."""
+    try:
+        await message.answer(text, **kwargs)
+    except exceptions.TelegramRetryAfter as e:
+        logger.warning(f"Flood limit exceeded while replying to {message.chat.id}. Sleep {e.retry_after}s")
+        await asyncio.sleep(e.retry_after)
+        await message.answer(text, **kwargs)
+
+
+def _format_promo_list_page(broadcasts, header: bool) -> str:
+    """Render one /promo_list page; only the first page carries the title."""
+    text = "📋 <b>Active Promotional Broadcasts:</b>\n\n" if header else ""
+
+    for broadcast in broadcasts:
+        slot_emoji = "🌅" if broadcast.time_slot.value == "MORNING" else "🌙"
+        preview = html.escape(broadcast.get_display_text())
+
+        keyboard_info = broadcast.keyboard_type or "None"
+        if broadcast.keyboard_type == "main" and broadcast.keyboard_button_text:
+            keyboard_info = f"Main ('{html.escape(broadcast.keyboard_button_text)}')"
+
+        text += (
+            f"{slot_emoji} <b>ID #{broadcast.id}</b>\n"
+            f"📅 {broadcast.time_slot.value.title()}\n"
+            f"🔢 Expires: {broadcast.deadline.strftime('%Y-%m-%d %H:%M')}\n"
+            f"📝 {preview}\n"
+            f"📱 Type: {broadcast.message_type.title()}\n"
+            f"⌨️ Keyboard: {keyboard_info}\n"
+            f"⏰ Created: {broadcast.created_at.strftime('%Y-%m-%d %H:%M')}\n\n"
+        )
+
+    return text
+
+
 @router.message(Command("promo_list"))
 async def promo_list_command(message: types.Message, user: UserSchema, services: RequestsService):
     """Handler for /promo_list command. Shows active promotional broadcasts."""
-    # Check if user is admin
-    if not user.telegram_id or user.telegram_id not in settings.rbac.owner_ids:
-        await message.answer("You don't have permission to use this command")
+    if not await _require_admin(user, message):
         return
 
     try:
-        broadcasts = await services.repo.promotional_broadcasts.get_all_active()
-
-        if not broadcasts:
-            await message.answer("📭 No active promotional broadcasts found.")
-            return
-
-        text = "📋 **Active Promotional Broadcasts:**\n\n"
-
-        for broadcast in broadcasts:
-            slot_emoji = "🌅" if broadcast.time_slot.value == "MORNING" else "🌙"
-            preview = broadcast.get_display_text()
-
-            keyboard_info = broadcast.keyboard_type or "None"
-            if broadcast.keyboard_type == "main" and broadcast.keyboard_button_text:
-                keyboard_info = f"Main ('{broadcast.keyboard_button_text}')"
-
-            text += (
-                f"{slot_emoji} **ID #{broadcast.id}**\n"
-                f"📅 {broadcast.time_slot.value.title()}\n"
-                f"🔢 Expires: {broadcast.deadline.strftime('%Y-%m-%d %H:%M')}\n"
-                f"📝 {preview}\n"
-                f"📱 Type: {broadcast.message_type.title()}\n"
-                f"⌨️ Keyboard: {keyboard_info}\n"
-                f"⏰ Created: {broadcast.created_at.strftime('%Y-%m-%d %H:%M')}\n\n"
-            )
-
-        # Split message if too long
-        if len(text) > 4000:
-            await message.answer(text[:4000] + "...", parse_mode="Markdown")
-            await message.answer(text[4000:], parse_mode="Markdown")
+        cached = await services.redis.get(PROMO_LIST_CACHE_KEY)
+        if cached:
+            pages = json.loads(cached)
         else:
-            await message.answer(text, parse_mode="Markdown")
+            pages = []
+            offset = 0
+            while True:
+                broadcasts = await services.repo.promotional_broadcasts.get_active_paginated(
+                    limit=PROMO_LIST_PAGE_SIZE, offset=offset
+                )
+                if broadcasts:
+                    pages.append(_format_promo_list_page(broadcasts, header=not pages))
+                if len(broadcasts) < PROMO_LIST_PAGE_SIZE:
+                    break
+                offset += PROMO_LIST_PAGE_SIZE
+
+            if not pages:
+                await message.answer("📭 No active promotional broadcasts found.")
+                return
+
+            await services.redis.set(PROMO_LIST_CACHE_KEY, json.dumps(pages), ex=PROMO_LIST_CACHE_TTL)
+
+        # One message per page, sent in order so the list reads top to bottom. Pages all go to
+        # the same chat, so sending them concurrently would only reorder them and trip the
+        # per-chat flood limit; back off on RetryAfter instead.
+        for page in pages:
+            await _answer_with_retry(message, page, parse_mode="HTML")
 
     except Exception as e:
         logger.error(f"Failed to list promotional broadcasts: {e}")
@@ -833,35 +921,33 @@ async def promo_list_command(message: types.Message, user: UserSchema, services:
 
 
 @router.message(Command("promo_cancel"))
-async def promo_cancel_command(message: types.Message, user: UserSchema, services: RequestsService):
+async def promo_cancel_command(
+    message: types.Message, command: CommandObject, user: UserSchema, services: RequestsService
+):
     """Handler for /promo_cancel command. Cancel a promotional broadcast by ID."""
-    # Check if user is admin
-    if not user.telegram_id or user.telegram_id not in settings.rbac.owner_ids:
-        await message.answer("You don't have permission to use this command")
+    if not await _require_admin(user, message):
         return
 
     # Extract broadcast ID from command
-    parts = message.text.split()
-    if len(parts) != 2:
+    if not _BROADCAST_ID_RE.fullmatch((command.args or "").strip()):
         await message.answer(
-            "❌ **Usage:** `/promo_cancel <broadcast_id>`\n\n"
-            "Example: `/promo_cancel 123`\n"
-            "Use `/promo_list` to see active broadcasts.",
-            parse_mode="Markdown",
+            "❌ <b>Usage:</b> <code>/promo_cancel &lt;broadcast_id&gt;</code>\n\n"
+            "Example: <code>/promo_cancel 123</code>\n"
+            "Use <code>/promo_list</code> to see active broadcasts.",
+            parse_mode="HTML",
         )
         return
 
     try:
-        broadcast_id = int(parts[1])
+        broadcast_id = int(command.args)
         success = await services.repo.promotional_broadcasts.deactivate_broadcast(broadcast_id)
 
         if success:
+            await services.redis.delete(PROMO_LIST_CACHE_KEY)
             await message.answer(f"✅ Promotional broadcast #{broadcast_id} has been cancelled.")
         else:
             await message.answer(f"❌ Promotional broadcast #{broadcast_id} not found or already inactive.")
 
-    except ValueError:
-        await message.answer("❌ Invalid broadcast ID. Please provide a number.")
     except Exception as e:
         logger.error(f"Failed to cancel promotional broadcast: {e}")
         await message.answer("❌ Error cancelling promotional broadcast.")
@@ -870,82 +956,35 @@ async def promo_cancel_command(message: types.Message, user: UserSchema, service
 @router.message(Command("giftsub"))
 async def giftsub_command(message: types.Message, command: CommandObject, user: UserSchema, services: RequestsService):
     """Handler for /giftsub command. Gift a subscription to a user."""
-    # Check if user is admin
-    if not user.telegram_id or user.telegram_id not in settings.rbac.owner_ids:
-        await message.answer("You don't have permission to use this command")
+    if not await _require_admin(user, message):
         return
 
     if not command.args:
         await message.answer("Usage: /giftsub <user_id> <week|month|year|max>")
         return
 
-    # Parse arguments
-    args = command.args.split()
-    if len(args) != 2:
-        await message.answer("Invalid arguments. Usage: /giftsub <user_id> <week|month|year|max>")
+    # Parse and validate arguments in one pass
+    match = _GIFTSUB_RE.fullmatch(command.args.strip())
+    if not match:
+        await message.answer(
+            "Invalid arguments. Usage: /giftsub <telegram_id> <week|month|year|max> (Telegram ID must be numeric)"
+        )
         return
 
-    user_identifier, duration_type = args
-
-    # Convert duration to days
-    duration_days = 0
-    if duration_type == "week":
-        duration_days = 7
-    elif duration_type == "month":
-        duration_days = 30
-    elif duration_type == "year":
-        duration_days = 365
-    elif duration_type == "max":
-        duration_days = 365 * 5  # 5 years
-    else:
-        await message.answer("Invalid duration. Use week, month, year, or max")
-        return
+    telegram_id = int(match[1])
+    duration_type = match[2]
+    duration_days = _DUR_DAYS[duration_type]
 
     # Find the target user
-    try:
-        telegram_id = int(user_identifier)
-        target_user = await services.users.get_by_telegram_id(telegram_id)
-
-        if not target_user:
-            await message.answer(f"User with Telegram ID {telegram_id} not found")
-            return
-    except ValueError:
-        await message.answer("Invalid Telegram ID. Please provide a numeric Telegram ID")
+    target_user = await services.users.get_by_telegram_id(telegram_id)
+    if not target_user:
+        await message.answer(f"User with Telegram ID {telegram_id} not found")
         return
 
     # Gift the subscription
     try:
-        # Get current subscription if exists
-        subscription = await services.subscriptions.get_subscription_for_user(target_user.id)
-        now = datetime.now(UTC)
-
-        # Calculate the new end date
-        if subscription and subscription.end_date > now:
-            # Extend existing subscription
-            new_end_date = subscription.end_date + timedelta(days=duration_days)
-
-            # Update the subscription
-            subscription = await services.repo.subscriptions.update(
-                subscription.id,
-                {
-                    "end_date": new_end_date,
-                    "status": "ACTIVE",
-                },
-            )
-        else:
-            # Create new subscription
-            subscription = await services.repo.subscriptions.create(
-                {
-                    "user_id": target_user.id,
-                    "product_id": "GIFT_SUB",
-                    "provider_id": "GIFT",
-                    "status": "ACTIVE",
-                    "currency": "RUB",
-                    "start_date": now,
-                    "end_date": now + timedelta(days=duration_days),
-                    "recurring_details": {"gifted_by": user.id},
-                }
-            )
+        # Extend the live subscription or create a gift one; concurrent gifts to this user wait on its row lock
+        subscription = await services.subscriptions.gift_or_extend(target_user.id, duration_days, gifted_by=user.id)
 
         # Update user's onboarding status if needed
         await services.users.update_user(target_user.id, UpdateUserRequest(is_onboarded=True))
@@ -2,15 +2,19 @@ import dataclasses
 import hashlib
 import hmac
 import json
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 from json import JSONDecodeError
-from urllib.parse import parse_qsl, unquote
+from urllib.parse import parse_qsl, unquote_plus
 from uuid import UUID, uuid4
 
 from fastapi import Depends, HTTPException, Request, Response
+from pydantic import ValidationError
+from pydantic_core import from_json, to_json
 
 from app.services.requests import RequestsService
-from app.webhook.dependencies.service import get_services
+from app.webhook.dependencies.service import get_services, get_services_ro
 from core.infrastructure.config import settings
 from core.infrastructure.database.models.enums import UserType
 from core.infrastructure.i18n import i18n
@@ -18,6 +22,7 @@ from core.infrastructure.logging import get_logger
 from core.infrastructure.redis import RedisClient
 from core.infrastructure.sentry_context import set_sentry_user
 from core.schemas.users import UserSchema
+from core.services.sessions import SESSION_USER_CACHE_TTL_SECONDS, session_user_cache_key
 
 logger = get_logger(__name__)
 
@@ -26,6 +31,16 @@ MOCK_GUEST_USER_ID = UUID("00000000-0000-0000-0000-000000000001")  # Fixed UUID
 # Session Configuration - app-specific to avoid conflicts between apps
 SESSION_COOKIE_NAME = f"{settings.app_name}_session"
 SESSION_KEY_PREFIX = f"{settings.app_name}:session:"
+SESSION_USER_INDEX_PREFIX = f"{settings.app_name}:user_sessions:"  # per-user set of session ids
+SESSION_TTL_SECONDS = settings.session.expire_days * 24 * 60 * 60
+# Sliding expiration only pushes the TTL back once a tenth of it has been used up
+_SESSION_REFRESH_BELOW_SECONDS = int(SESSION_TTL_SECONDS * 0.9)
+_SESSION_COOKIE_KWARGS = {
+    "httponly": settings.session.cookie_httponly,
+    "secure": settings.session.cookie_secure,
+    "samesite": settings.session.cookie_samesite,
+    "path": "/",
+}
 
 # Initialize Redis client for sessions
 session_redis = RedisClient(settings.redis)
@@ -73,15 +88,15 @@ class TelegramAuthenticator:
         self._secret = secret
 
     @staticmethod
-    def _parse_init_data(data: str) -> dict:
-        """Convert init_data string into dictionary.
+    def _parse_init_data(data: str) -> list[tuple[str, str]]:
+        """Split init_data string into (key, value) pairs sorted by key.
 
         Args:
             data: the query string passed by the webapp
         """
         if not data:
             raise InvalidInitDataError("Init Data cannot be empty")
-        return dict(parse_qsl(data))
+        return sorted(parse_qsl(data, keep_blank_values=True))
 
     @staticmethod
     def _parse_user_data(data: str) -> dict:
@@ -94,7 +109,7 @@ class TelegramAuthenticator:
             InvalidInitDataError
         """
         try:
-            return json.loads(unquote(data))
+            return json.loads(data)
         except JSONDecodeError:
             raise InvalidInitDataError("Cannot decode init data")
 
@@ -112,7 +127,7 @@ class TelegramAuthenticator:
             bool: Validation result
         """
         token_bytes = token.encode("utf-8")
-        client_hash = hmac.new(self._secret, token_bytes, hashlib.sha256).hexdigest()
+        client_hash = hmac.digest(self._secret, token_bytes, hashlib.sha256).hex()
         return hmac.compare_digest(client_hash, hash_)
 
     def verify_token(self, token: str) -> TelegramUser:
@@ -131,25 +146,29 @@ class TelegramAuthenticator:
         Raises:
             InvalidInitDataError: if the token is invalid
         """
-        init_data = self._parse_init_data(token)
-        token = "\n".join(
-            f"{key}={val}" for key, val in sorted(init_data.items(), key=lambda item: item[0]) if key != "hash"
-        )
-        token = unquote(token)
-        hash_ = init_data.get("hash")
+        # Single pass over the sorted pairs: pull out hash and user, collect the rest for the check string.
+        # parse_qsl already unquoted the values; unquoting again would corrupt literal "%xx" sequences
+        hash_ = user_data = None
+        check_parts = []
+        for key, val in self._parse_init_data(token):
+            if key == "hash":
+                hash_ = val
+                continue
+            if key == "user":
+                user_data = val
+            check_parts.append(f"{key}={val}")
+
         if not hash_:
             raise InvalidInitDataError("Init data does not contain hash")
 
         hash_ = hash_.strip()
 
-        if not self._validate(hash_, token):
+        if not self._validate(hash_, "\n".join(check_parts)):
             raise InvalidInitDataError("Invalid token")
 
-        user_data = init_data.get("user")
         if not user_data:
             raise InvalidInitDataError("Init data does not contain user")
 
-        user_data = unquote(user_data)
         user_data = self._parse_user_data(user_data)
         return TelegramUser(**user_data)
 
@@ -162,7 +181,9 @@ class InvalidInitDataError(Exception):
     pass
 
 
+@lru_cache
 def get_telegram_authenticator() -> TelegramAuthenticator:
+    """Process-wide authenticator; the bot token (and so the derived secret) never changes at runtime."""
     secret_key = generate_secret_key(settings.bot.token)
     return TelegramAuthenticator(secret_key)
 
@@ -172,36 +193,45 @@ def get_telegram_authenticator() -> TelegramAuthenticator:
 # =============================================================================
 
 
+# Built once at import: validating ~25 fields on every guest request is wasted work.
+# Callers must not mutate it - use model_copy(update=...) instead.
+_MOCK_GUEST_USER = UserSchema(
+    id=MOCK_GUEST_USER_ID,
+    display_name="Guest",
+    username=None,
+    avatar_url=None,
+    user_type=UserType.GUEST,
+    telegram_id=None,
+    language_code="en",
+    tg_first_name="Guest",
+    tg_last_name=None,
+    tg_username=None,
+    tg_language_code="en",
+    tg_is_premium=None,
+    tg_is_bot=None,
+    tg_added_to_attachment_menu=None,
+    tg_allows_write_to_pm=None,
+    tg_photo_url=None,
+    male=None,
+    birth_date=None,
+    is_onboarded=False,
+    is_terms_accepted=False,
+    timezone="UTC",
+    current_streak=0,
+    best_streak=0,
+    last_activity_date=None,
+    total_active_days=0,
+    created_at=datetime(2024, 1, 1, tzinfo=UTC),  # Fixed old date to avoid "is_new" logic
+    updated_at=datetime(2024, 1, 1, tzinfo=UTC),
+)
+
+
+# Guest row as written to the database (timestamps are set by the repo)
+_MOCK_GUEST_USER_FOR_DB = _MOCK_GUEST_USER.model_copy(update={"created_at": None, "updated_at": None})
+
+
 def get_mock_guest_user() -> UserSchema:
-    return UserSchema(
-        id=MOCK_GUEST_USER_ID,
-        display_name="Guest",
-        username=None,
-        avatar_url=None,
-        user_type=UserType.GUEST,
-        telegram_id=None,
-        language_code="en",
-        tg_first_name="Guest",
-        tg_last_name=None,
-        tg_username=None,
-        tg_language_code="en",
-        tg_is_premium=None,
-        tg_is_bot=None,
-        tg_added_to_attachment_menu=None,
-        tg_allows_write_to_pm=None,
-        tg_photo_url=None,
-        male=None,
-        birth_date=None,
-        is_onboarded=False,
-        is_terms_accepted=False,
-        timezone="UTC",
-        current_streak=0,
-        best_streak=0,
-        last_activity_date=None,
-        total_active_days=0,
-        created_at=datetime(2024, 1, 1, tzinfo=UTC),  # Fixed old date to avoid "is_new" logic
-        updated_at=datetime.now(UTC),
-    )
+    return _MOCK_GUEST_USER
 
 
 # =============================================================================
@@ -219,16 +249,22 @@ async def create_session(user_id: UUID, user_type: str) -> str:
     session_id = str(uuid4())
     session_key = f"{SESSION_KEY_PREFIX}{session_id}"
 
+    now = time.time()
     session_data = {
-        "user_id": str(user_id),  # Convert UUID to string for JSON serialization
+        "user_id": user_id,  # to_json writes UUIDs as strings
         "user_type": user_type,
-        "created_at": datetime.now(UTC).isoformat(),
-        "last_accessed": datetime.now(UTC).isoformat(),
+        "created_at": now,  # unix epoch seconds
+        "last_accessed": now,
     }
 
-    # Store session with TTL
-    expire_seconds = settings.session.expire_days * 24 * 60 * 60
-    await session_redis.set(session_key, json.dumps(session_data), ex=expire_seconds)
+    # Store session with TTL and index it under the user, in one round-trip
+    await session_redis.set_and_index(
+        session_key,
+        to_json(session_data),
+        ex=SESSION_TTL_SECONDS,
+        index_key=f"{SESSION_USER_INDEX_PREFIX}{user_id}",
+        member=session_id,
+    )
 
     logger.info(f"Created session {session_id} for user {user_id}")
     return session_id
@@ -238,6 +274,10 @@ async def validate_session(session_id: str) -> dict | None:
     """
     Validate session ID and return user data if valid.
 
+    Extends the session TTL (and the user's session index TTL) with a bare
+    EXPIRE when it has decayed past the refresh threshold; the stored session
+    data is not rewritten on reads.
+
     Returns:
         dict: Session data with user info if valid
         None: If session is invalid or expired
@@ -248,21 +288,23 @@ async def validate_session(session_id: str) -> dict | None:
     session_key = f"{SESSION_KEY_PREFIX}{session_id}"
 
     try:
-        session_data_raw = await session_redis.get(session_key)
+        session_data_raw, ttl = await session_redis.get_with_ttl(session_key)
         if not session_data_raw:
             return None
 
-        session_data = json.loads(session_data_raw.decode("utf-8"))
-
-        # Update last accessed time and extend TTL
-        session_data["last_accessed"] = datetime.now(UTC).isoformat()
-        expire_seconds = settings.session.expire_days * 24 * 60 * 60
+        session_data = from_json(session_data_raw)
 
-        await session_redis.set(session_key, json.dumps(session_data), ex=expire_seconds)
+        if ttl < _SESSION_REFRESH_BELOW_SECONDS:
+            # Keep the user's session index alive as long as its sessions
+            await session_redis.expire_with_index(
+                session_key,
+                SESSION_TTL_SECONDS,
+                index_key=f"{SESSION_USER_INDEX_PREFIX}{session_data['user_id']}",
+            )
 
         return session_data
 
-    except (json.JSONDecodeError, KeyError) as e:
+    except (ValueError, KeyError) as e:
         logger.warning(f"Invalid session data for {session_id}: {e}")
         return None
     except Exception as e:
@@ -283,7 +325,16 @@ async def destroy_session(session_id: str) -> bool:
     session_key = f"{SESSION_KEY_PREFIX}{session_id}"
 
     try:
-        result = await session_redis.delete(session_key)
+        session_data_raw = await session_redis.get(session_key)
+        if not session_data_raw:
+            return False
+
+        user_id = from_json(session_data_raw).get("user_id")
+        result = await session_redis.delete_and_unindex(
+            [session_key, session_user_cache_key(session_key)],
+            index_key=f"{SESSION_USER_INDEX_PREFIX}{user_id}",
+            member=session_id,
+        )
         logger.info(f"Destroyed session {session_id}")
         return bool(result)
     except Exception as e:
@@ -298,11 +349,8 @@ def set_session_cookie(response: Response, session_id: str) -> None:
     response.set_cookie(
         key=SESSION_COOKIE_NAME,
         value=session_id,
-        max_age=settings.session.expire_days * 24 * 60 * 60,
-        httponly=settings.session.cookie_httponly,
-        secure=settings.session.cookie_secure,
-        samesite=settings.session.cookie_samesite,
-        path="/",
+        max_age=SESSION_TTL_SECONDS,
+        **_SESSION_COOKIE_KWARGS,
     )
 
 
@@ -310,13 +358,7 @@ def clear_session_cookie(response: Response) -> None:
     """
     Clear session cookie from the response.
     """
-    response.delete_cookie(
-        key=SESSION_COOKIE_NAME,
-        httponly=settings.session.cookie_httponly,
-        secure=settings.session.cookie_secure,
-        samesite=settings.session.cookie_samesite,
-        path="/",
-    )
+    response.delete_cookie(key=SESSION_COOKIE_NAME, **_SESSION_COOKIE_KWARGS)
 
 
 # =============================================================================
@@ -324,11 +366,19 @@ def clear_session_cookie(response: Response) -> None:
 # =============================================================================
 
 
+_MOCK_INIT_DATA_KEYS = frozenset({"mock_init_data", "user"})
+
+
 async def _get_mock_user_from_init_data(init_data: str, services: RequestsService) -> UserSchema | None:
     """Parse mock user data from frontend initData and get or create the user."""
     try:
-        # Parse the mock init data
-        init_data_dict = dict(parse_qsl(init_data))
+        # Single pass over the query string, keeping only the two keys we need
+        init_data_dict = {}
+        for pair in init_data.split("&"):
+            key, _, value = pair.partition("=")
+            if key in _MOCK_INIT_DATA_KEYS:
+                # Decode only when there is something to decode
+                init_data_dict[key] = unquote_plus(value) if "%" in value or "+" in value else value
 
         # Check if this is mock data
         if init_data_dict.get("mock_init_data") != "true":
@@ -339,9 +389,7 @@ async def _get_mock_user_from_init_data(init_data: str, services: RequestsServic
         if not user_data_encoded:
             return None
 
-        # Decode and parse user data
-        user_data_str = unquote(user_data_encoded)
-        user_data = json.loads(user_data_str)
+        user_data = from_json(user_data_encoded)
 
         # Create or get the mock user
         first_name = user_data.get("first_name", "Mock User")
@@ -366,7 +414,7 @@ async def _get_mock_user_from_init_data(init_data: str, services: RequestsServic
         )
 
         # Get or create the user in database
-        db_user = await services.users.get_or_create_user(mock_user_schema)
+        db_user = await services.users.upsert_by_telegram_id(mock_user_schema)
         logger.info(f"Mock user {db_user.id} authenticated from frontend selector")
         i18n.set_user_locale(db_user)
 
@@ -378,7 +426,7 @@ async def _get_mock_user_from_init_data(init_data: str, services: RequestsServic
             tg_username=db_user.tg_username,
         )
 
-        return UserSchema.model_validate(db_user)
+        return db_user
 
     except (JSONDecodeError, KeyError, ValueError) as e:
         logger.warning(f"Failed to parse mock user data: {e}")
@@ -388,9 +436,8 @@ async def _get_mock_user_from_init_data(init_data: str, services: RequestsServic
         return None
 
 
-async def _authenticate_telegram(request: Request, services: RequestsService) -> UserSchema:
-    """Authenticate Telegram user via initData"""
-    init_data = request.headers.get("initData")
+async def _authenticate_telegram(request: Request, services: RequestsService, init_data: str) -> UserSchema:
+    """Authenticate Telegram user via initData (header value read once by get_user)"""
 
     # TODO: to be removed, never will be called with new logic
     # if not init_data:
@@ -406,10 +453,10 @@ async def _authenticate_telegram(request: Request, services: RequestsService) ->
     user = telegram_authenticator.verify_token(init_data)
 
     # Register or update user in the database
-    # Map TelegramUser fields to UserSchema with tg_ prefix
+    # Map TelegramUser fields to UserSchema with tg_ prefix (already validated, so construct without re-validating)
     display_name = f"{user.first_name or ''} {user.last_name or ''}".strip() or user.username or "User"
-    db_user = await services.users.get_or_create_user(
-        UserSchema(
+    db_user = await services.users.upsert_by_telegram_id(
+        UserSchema.model_construct(
             telegram_id=user.id,
             # App profile fields (populated from TG data on first login)
             display_name=display_name,
@@ -442,7 +489,21 @@ async def _authenticate_telegram(request: Request, services: RequestsService) ->
         tg_username=db_user.tg_username,
     )
 
-    return UserSchema.model_validate(db_user)
+    return db_user
+
+
+def _set_session_user(request: Request, user: UserSchema) -> None:
+    """Bind a session-authenticated user to the request (locale, request.state, Sentry)."""
+    i18n.set_user_locale(user)
+    request.state.user = user
+
+    # Set Sentry user context
+    set_sentry_user(
+        user_id=str(user.id),
+        username=user.username,
+        email=user.email,
+        tg_username=user.tg_username,
+    )
 
 
 async def _authenticate_session(request: Request, services: RequestsService) -> UserSchema | None:
@@ -457,6 +518,24 @@ async def _authenticate_session(request: Request, services: RequestsService) ->
     if not session_id:
         return None
 
+    # Recently resolved user for this session: skip session validation and the DB lookup
+    user_cache_key = session_user_cache_key(f"{SESSION_KEY_PREFIX}{session_id}")
+    try:
+        cached_user = await session_redis.get(user_cache_key)
+    except Exception as e:
+        logger.warning(f"Session user cache unavailable for {session_id}: {e}")
+        cached_user = None
+    if cached_user:
+        # One pass in pydantic-core; model_construct() would leave id/datetimes/enums as JSON strings
+        try:
+            user = UserSchema.model_validate_json(cached_user)
+        except ValidationError as e:
+            # e.g. written by a deploy with a different UserSchema: treat as a miss and re-cache below
+            logger.warning(f"Discarding unreadable cached user for session {session_id}: {e}")
+        else:
+            _set_session_user(request, user)
+            return user
+
     session_data = await validate_session(session_id)
     if not session_data:
         return None
@@ -465,35 +544,28 @@ async def _authenticate_session(request: Request, services: RequestsService) ->
     if not user_id_str:
         return None
 
+    # Only reached on a user-cache miss, so the UUID is parsed at most once per cache TTL
     try:
-        # Convert user_id from string to UUID
         user_id = UUID(user_id_str)
+    except ValueError as e:
+        logger.warning(f"Invalid UUID in session {session_id}: {e}")
+        return None
 
-        # Get user from database
-        user_db = await services.users.get_user_by_id(user_id)
-        if not user_db:
+    try:
+        db_user = await services.repo.users.get_user_by_id(user_id)
+        if db_user is None:
             logger.warning(f"User {user_id} not found for session {session_id}")
             # Clean up invalid session
             await destroy_session(session_id)
             return None
 
-        logger.info(f"Session user {user_db.id} authenticated")
-        i18n.set_user_locale(user_db)
-        request.state.user = user_db
+        user = UserSchema.model_validate(db_user)
+        logger.info(f"Session user {user.id} authenticated")
+        _set_session_user(request, user)
+        await session_redis.set(user_cache_key, user.model_dump_json(), ex=SESSION_USER_CACHE_TTL_SECONDS)
 
-        # Set Sentry user context
-        set_sentry_user(
-            user_id=str(user_db.id),
-            username=user_db.username,
-            email=user_db.email,
-            tg_username=user_db.tg_username,
-        )
-
-        return UserSchema.model_validate(user_db)
+        return user
 
-    except ValueError as e:
-        logger.warning(f"Invalid UUID in session {session_id}: {e}")
-        return None
     except Exception as e:
         logger.error(f"Error authenticating session {session_id}: {e}")
         return None
@@ -501,15 +573,13 @@ async def _authenticate_session(request: Request, services: RequestsService) ->
 
 async def _get_mock_guest_user(request: Request, services: RequestsService) -> UserSchema:
     """Return mock guest user - creates in database if needed for update operations"""
-    mock_user_data = get_mock_guest_user()
+    # Read the existing guest row by primary key; only the first request writes it
+    db_user = await services.repo.users.get_user_by_id(MOCK_GUEST_USER_ID)
+    if db_user is not None:
+        user_schema = UserSchema.model_validate(db_user)
+    else:
+        user_schema = await services.users.get_or_create_user(_MOCK_GUEST_USER_FOR_DB)
 
-    # Exclude created_at/updated_at as repo sets these automatically
-    mock_user_for_db = mock_user_data.model_copy(update={"created_at": None, "updated_at": None})
-
-    # Create or get the mock guest user in database to support update operations
-    db_user = await services.users.get_or_create_user(mock_user_for_db)
-
-    user_schema = UserSchema.model_validate(db_user)
     request.state.user = user_schema
     i18n.set_user_locale(user_schema)
     logger.info(f"Mock guest user {MOCK_GUEST_USER_ID} provided (from database)")
@@ -533,7 +603,25 @@ async def _get_mock_guest_user(request: Request, services: RequestsService) -> U
 async def get_user(
     request: Request,
     services: RequestsService = Depends(get_services),
+) -> UserSchema:
+    """Universal user authentication on the request's transactional services."""
+    return await _resolve_user(request, services)
+
+
+async def get_user_ro(
+    request: Request,
+    services: RequestsService = Depends(get_services_ro),
 ) -> UserSchema:
+    """
+    Like get_user, on the read-only services - for read-only endpoints that also use get_services_ro.
+
+    Shares the endpoint's session, so the request holds one pooled connection. The writes auth
+    may do (Telegram user upsert, guest creation) are single statements and commit on their own.
+    """
+    return await _resolve_user(request, services)
+
+
+async def _resolve_user(request: Request, services: RequestsService) -> UserSchema:
     """
     Universal user authentication that detects platform and returns UserSchema.
 
@@ -546,12 +634,14 @@ async def get_user(
     Always returns UserSchema - universal authentication for all platforms.
     """
 
+    headers = request.headers
+    init_data = headers.get("initData")
+
     # Check for mock platform mode in debug environment
-    if request.headers.get("Mock-Platform") == "true" and settings.debug:
+    if settings.debug and headers.get("Mock-Platform") == "true":
         logger.info("Mock platform mode enabled - checking for mock user data")
 
         # Try to get mock user from frontend initData
-        init_data = request.headers.get("initData")
         if init_data:
             mock_user = await _get_mock_user_from_init_data(init_data, services)
             if mock_user:
@@ -562,9 +652,9 @@ async def get_user(
         logger.info("No mock user data in initData, falling through to normal auth")
 
     # Check for Telegram authentication first
-    if request.headers.get("initData"):
+    if init_data:
         try:
-            return await _authenticate_telegram(request, services)
+            return await _authenticate_telegram(request, services, init_data)
         except (InvalidInitDataError, NoInitDataError) as e:
             # Telegram auth failed, fall through to next auth method
             logger.warning(f"Telegram authentication failed: {e}")
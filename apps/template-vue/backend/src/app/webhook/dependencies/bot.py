@@ -5,10 +5,20 @@ from aiogram.client.default import DefaultBotProperties
 
 from core.infrastructure.config import settings
 
+# One Bot per process: its aiohttp session keeps connections to the Bot API pooled across requests
+_bot: Bot | None = None
+
 
 async def get_bot() -> AsyncGenerator[Bot]:
-    bot = Bot(token=settings.bot.token, default=DefaultBotProperties(parse_mode="Markdown"))
-    try:
-        yield bot
-    finally:
-        await bot.session.close()
+    global _bot
+    if _bot is None:
+        _bot = Bot(token=settings.bot.token, default=DefaultBotProperties(parse_mode="Markdown"))
+    yield _bot
+
+
+async def close_bot() -> None:
+    """Close the shared Bot's HTTP session (registered as an app shutdown callback)."""
+    global _bot
+    if _bot is not None:
+        await _bot.session.close()
+        _bot = None
@@ -4,6 +4,8 @@ from core.infrastructure.config import settings
 
 engine = create_engine(settings.db)
 session_pool = create_session_pool(engine)
+# Same pool; connections run in AUTOCOMMIT while checked out by a read-only session
+readonly_session_pool = create_session_pool(engine.execution_options(isolation_level="AUTOCOMMIT"))
 
 
 async def get_repo():
@@ -29,3 +31,14 @@ async def get_repo():
         async with session.begin():
             yield RequestsRepo(session)
             # Automatic commit on exit (rollback on exception)
+
+
+async def get_repo_ro():
+    """
+    Provides a RequestsRepo for read-only endpoints, without a transaction.
+
+    Statements run in AUTOCOMMIT, so a read costs no BEGIN/COMMIT round-trips.
+    Do not use for endpoints that write: each flush would commit on its own.
+    """
+    async with readonly_session_pool() as session:
+        yield RequestsRepo(session)
@@ -50,7 +50,7 @@ async def get_stats(user: AdminUser, repo: RequestsRepo = Depends(get_repo)):
 @router.get("/me", response_model=MyPermissionsResponse)
 async def get_my_permissions(request: Request, user: AdminUser):
     settings = request.app.state.settings
-    is_config_owner = user.telegram_id in settings.rbac.owner_ids
+    is_config_owner = user.telegram_id in settings.rbac.owner_ids_set
 
     permissions = ["view_admin_panel", "view_stats"]
     if user.role == "admin" or is_config_owner:
@@ -5,14 +5,15 @@ from starlette.requests import Request
 
 from app.exceptions import UserNotFoundException
 from app.services.requests import RequestsService
-from app.webhook.auth import get_user
-from app.webhook.dependencies.service import get_services
+from app.webhook.auth import get_user, get_user_ro
+from app.webhook.dependencies.service import get_services, get_services_ro
 from core.infrastructure.fastapi.rate_limiter import HARD_LIMIT, SOFT_LIMIT, limiter
+from core.infrastructure.fastapi.responses import PydanticJSONResponse
 from core.infrastructure.logging import get_logger
 from core.schemas.start import StartData, StartParamsRequest
 from core.schemas.users import UserSchema
 
-router = APIRouter()
+router = APIRouter(default_response_class=PydanticJSONResponse)
 
 logger = get_logger(__name__)
 
@@ -21,8 +22,8 @@ logger = get_logger(__name__)
 @limiter.limit(SOFT_LIMIT)
 async def get_friends(
     request: Request,
-    services: RequestsService = Depends(get_services),
-    user: UserSchema = Depends(get_user),
+    services: RequestsService = Depends(get_services_ro),
+    user: UserSchema = Depends(get_user_ro),
 ) -> list[UserSchema]:
     friends = await services.users.get_friends(user.id)
     return friends
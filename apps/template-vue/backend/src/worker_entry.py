@@ -23,14 +23,15 @@ if __name__ == "__main__":
     # Get the WorkerSettings class
     worker_settings_cls = getattr(module, class_name)
 
-    # Create event loop explicitly for uvloop compatibility
-    # This is required in Python 3.10+ when uvloop is installed
+    # arq's Worker picks up asyncio.get_event_loop() on init, which no longer
+    # creates a loop on its own - set one up front (uvloop when installed)
     try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        # No event loop in current thread, create one
+        import uvloop
+
+        loop = uvloop.new_event_loop()
+    except ImportError:
         loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    asyncio.set_event_loop(loop)
 
     # Run the worker
     run_worker(worker_settings_cls)
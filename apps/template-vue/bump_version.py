@@ -7,8 +7,11 @@ from typing import Literal
 
 BumpType = Literal["patch", "minor", "major"]
 
+VERSION_RE = re.compile(r'version = "(\d+\.\d+\.\d+)"')
+VERSION_PREFIXES = str.maketrans("", "", "^v")
+
 def bump_version_number(version: str, bump_type: BumpType) -> str:
-    major, minor, patch = map(int, version.replace("^", "").replace("v", "").split("."))
+    major, minor, patch = map(int, version.translate(VERSION_PREFIXES).split("."))
 
     if bump_type == "major":
         return f"{major + 1}.0.0"
@@ -43,8 +46,7 @@ def update_backend_version(bump_type: BumpType):
         return
 
     content = pyproject_toml.read_text()
-    version_pattern = r'version = "(\d+\.\d+\.\d+)"'
-    match = re.search(version_pattern, content)
+    match = VERSION_RE.search(content)
 
     if not match:
         print("Version not found in pyproject.toml")
@@ -52,7 +54,7 @@ def update_backend_version(bump_type: BumpType):
 
     current_version = match.group(1)
     new_version = bump_version_number(current_version, bump_type)
-    new_content = re.sub(version_pattern, f'version = "{new_version}"', content)
+    new_content = VERSION_RE.sub(f'version = "{new_version}"', content, count=1)
 
     pyproject_toml.write_text(new_content)
     print(f"Backend version bumped: {current_version} -> {new_version}")
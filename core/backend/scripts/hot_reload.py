@@ -29,11 +29,20 @@ Technical:
     - Handles SIGTERM/SIGINT gracefully
 """
 
+import shlex
 import sys
 from pathlib import Path
 
 from watchfiles import run_process
 
+# Directories whose .py files never warrant a reload
+IGNORED_PARTS = ("__pycache__", "/.pytest_cache/", "/.ruff_cache/")
+
+
+def watch_filter(change, path: str) -> bool:
+    """Reload only on .py changes outside cache directories."""
+    return path.endswith(".py") and not any(part in path for part in IGNORED_PARTS)
+
 
 def main():
     """Main entry point for hot reload script."""
@@ -69,17 +78,15 @@ def main():
     # Determine if target is a module or script
     # If target contains dots, treat as module, otherwise as script
     if "." in target and not target.endswith(".py"):
-        # Module mode: python -m module.path
-        command = f"python -u -m {target}"
-        if target_args:
-            command += " " + " ".join(target_args)
+        # Module mode: python -m module.path [args]
+        argv = ["python", "-u", "-m", target, *target_args]
         mode = "module"
     else:
         # Script mode: python script.py [args]
-        command = f"python -u {target}"
-        if target_args:
-            command += " " + " ".join(target_args)
+        argv = ["python", "-u", target, *target_args]
         mode = "script"
+    # watchfiles only takes commands as strings - quote argv so it splits back unchanged
+    command = shlex.join(argv)
 
     print("=" * 60)
     print("🔥 Hot Reload Enabled")
@@ -97,13 +104,8 @@ def main():
     run_process(
         *watch_paths,
         target=command,
-        watch_filter=lambda change, path: (
-            str(path).endswith(".py")
-            and "__pycache__" not in str(path)
-            and ".pyc" not in str(path)
-            and "/.pytest_cache/" not in str(path)
-            and "/.ruff_cache/" not in str(path)
-        ),
+        target_type="command",
+        watch_filter=watch_filter,
     )
 
 
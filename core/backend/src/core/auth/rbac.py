@@ -2,8 +2,8 @@
 
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, Request, status
-from sqlalchemy import update
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import and_, case, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from core.infrastructure.config import settings
@@ -37,12 +37,10 @@ def require_role(*allowed_roles: UserRole):
     """
 
     async def role_checker(
-        request: Request,
         user: UserSchema = Depends(get_user),
     ):
         # Config override - these telegram_ids are ALWAYS owners
-        settings = request.app.state.settings
-        if user.telegram_id and user.telegram_id in settings.rbac.owner_ids:
+        if user.telegram_id and user.telegram_id in settings.rbac.owner_ids_set:
             return user  # Owner can access anything
 
         # Otherwise check DB role
@@ -102,23 +100,22 @@ async def sync_owner_roles(session_pool: async_sessionmaker[AsyncSession]) -> No
         return
 
     async with session_pool() as session:
-        # Promote: users in owner_ids list who don't have owner role
-        promote_result = await session.execute(
+        # One UPDATE promotes users in owner_ids who aren't owners and demotes owners who aren't listed
+        in_owner_ids = User.telegram_id.in_(owner_ids)
+        result = await session.execute(
             update(User)
-            .where(User.telegram_id.in_(owner_ids))
-            .where(User.role != UserRole.OWNER)
-            .values(role=UserRole.OWNER)
-        )
-        promoted = promote_result.rowcount
-
-        # Demote: users with owner role who are NOT in owner_ids list
-        demote_result = await session.execute(
-            update(User)
-            .where(User.role == UserRole.OWNER)
-            .where(User.telegram_id.notin_(owner_ids))
-            .values(role=UserRole.USER)
+            .where(
+                or_(
+                    and_(in_owner_ids, User.role != UserRole.OWNER),
+                    and_(User.role == UserRole.OWNER, ~in_owner_ids),
+                )
+            )
+            .values(role=case((in_owner_ids, UserRole.OWNER), else_=UserRole.USER))
+            .returning(User.role)
         )
-        demoted = demote_result.rowcount
+        new_roles = result.scalars().all()
+        promoted = sum(role == UserRole.OWNER for role in new_roles)
+        demoted = len(new_roles) - promoted
 
         await session.commit()
 
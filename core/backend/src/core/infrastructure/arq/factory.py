@@ -1,8 +1,8 @@
 """ARQ worker application factory."""
 
+import inspect
 from collections.abc import Callable
-from contextlib import asynccontextmanager
-from functools import wraps
+from functools import partial, wraps
 from typing import Protocol
 
 from aiogram import Bot
@@ -27,8 +27,8 @@ class DBConfig(Protocol):
 
     Provides async SQLAlchemy connection URL via `url` property.
 
-    Note: pool_size and pool_recycle are currently hardcoded in
-    core/infrastructure/database/setup.py (pool_size=20, pool_recycle=1800).
+    Note: pool_recycle is hardcoded in core/infrastructure/database/setup.py
+    (pool_recycle=1800); the worker sizes its pool via create_worker_settings.
     """
 
     url: str
@@ -49,6 +49,7 @@ class WorkerContext:
     Provides clean patterns for transaction management in worker jobs:
     - with_transaction(): Single operation in a transaction
     - with_repo(): Direct repo access (read-only, no transaction)
+    - with_connection(): Raw connection in a transaction, no repo/services
     - Direct access to bot, redis, arq, producer for external API calls
 
     Example:
@@ -62,20 +63,34 @@ class WorkerContext:
             await ctx.bot.send_message(...)
     """
 
+    # Built for every job - no per-instance __dict__
+    __slots__ = (
+        "ctx_dict",
+        "session_pool",
+        "bot",
+        "repo_class",
+        "service_factory",
+        "redis",
+        "arq",
+        "producer",
+        "engine",
+    )
+
     def __init__(self, ctx_dict: dict):
         self.ctx_dict = ctx_dict
         self.session_pool = ctx_dict["session_pool"]
         self.bot = ctx_dict["bot"]
         self.repo_class = ctx_dict["repo_class"]
         self.service_factory = ctx_dict["service_factory"]
+        self.engine = ctx_dict["engine"]
 
         # Optional dependencies
-        self.redis = ctx_dict.get("redis")
-        self.arq = ctx_dict.get("arq")
-        self.producer = ctx_dict.get("producer")
+        get = ctx_dict.get
+        self.redis = get("redis")
+        self.arq = get("arq")
+        self.producer = get("producer")
 
-    @asynccontextmanager
-    async def with_transaction(self):
+    def with_transaction(self) -> _TransactionScope:
         """
         Context manager that provides services within a transaction.
 
@@ -88,14 +103,9 @@ class WorkerContext:
                 await services.balance.update_balance(user_id, balance)
                 # Transaction commits here
         """
-        async with self.session_pool() as session:
-            async with session.begin():
-                repo = self.repo_class(session)
-                services = self.service_factory(repo=repo, bot=self.bot)
-                yield services
-
-    @asynccontextmanager
-    async def with_repo(self):
+        return _TransactionScope(self)
+
+    def with_repo(self) -> _RepoScope:
         """
         Context manager that provides repo without transaction.
 
@@ -105,8 +115,79 @@ class WorkerContext:
             async with ctx.with_repo() as repo:
                 users = await repo.users.get_all()
         """
-        async with self.session_pool() as session:
-            yield self.repo_class(session)
+        return _RepoScope(self)
+
+    def with_connection(self):
+        """
+        Context manager that provides a raw connection within a transaction.
+
+        Use for single statements that need neither repo nor services
+        (e.g. a bulk UPDATE in a cron job). Commits on success, rolls back on exception.
+
+        Usage:
+            async with ctx.with_connection() as conn:
+                result = await conn.execute(stmt)
+        """
+        return self.engine.begin()
+
+
+# Plain async context managers rather than @asynccontextmanager: these are entered
+# by every job, and skip the generator and contextlib wrapper on each enter/exit.
+
+
+class _RepoScope:
+    """Session scope yielding a repo, returned by WorkerContext.with_repo()."""
+
+    __slots__ = ("_ctx", "_session")
+
+    def __init__(self, ctx: WorkerContext):
+        self._ctx = ctx
+
+    async def __aenter__(self):
+        self._session = self._ctx.session_pool()
+        session = await self._session.__aenter__()
+        try:
+            return self._ctx.repo_class(session)
+        except BaseException as e:
+            await self._session.__aexit__(type(e), e, e.__traceback__)
+            raise
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return await self._session.__aexit__(exc_type, exc, tb)
+
+
+class _TransactionScope:
+    """Session + transaction scope yielding services, returned by WorkerContext.with_transaction()."""
+
+    __slots__ = ("_ctx", "_session", "_transaction")
+
+    def __init__(self, ctx: WorkerContext):
+        self._ctx = ctx
+
+    async def __aenter__(self):
+        ctx = self._ctx
+        self._session = ctx.session_pool()
+        session = await self._session.__aenter__()
+        try:
+            self._transaction = session.begin()
+            await self._transaction.__aenter__()
+        except BaseException as e:
+            await self._session.__aexit__(type(e), e, e.__traceback__)
+            raise
+        try:
+            return ctx.service_factory(repo=ctx.repo_class(session), bot=ctx.bot)
+        except BaseException as e:
+            await self.__aexit__(type(e), e, e.__traceback__)
+            raise
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Commit/rollback first; the session is closed even if that fails
+        try:
+            await self._transaction.__aexit__(exc_type, exc, tb)
+        except BaseException as e:
+            await self._session.__aexit__(type(e), e, e.__traceback__)
+            raise
+        return await self._session.__aexit__(exc_type, exc, tb)
 
 
 def inject_context(func):
@@ -128,11 +209,12 @@ def inject_context(func):
     """
 
     @wraps(func)
-    async def wrapper(ctx_dict, *args, **kwargs):
-        ctx = WorkerContext(ctx_dict)
-        return await func(ctx, *args, **kwargs)
+    def wrapper(ctx_dict, *args, **kwargs):
+        # Hand the job's own coroutine back to ARQ - no extra coroutine to await per job
+        return func(WorkerContext(ctx_dict), *args, **kwargs)
 
-    return wrapper
+    # ARQ only registers coroutine functions
+    return inspect.markcoroutinefunction(wrapper)
 
 
 def create_worker_settings(
@@ -146,6 +228,8 @@ def create_worker_settings(
     cron_jobs: list | None = None,
     max_jobs: int = 10,
     job_timeout: int = 600,
+    db_pool_size: int | None = None,
+    db_max_overflow: int | None = None,
 ):
     """
     Create ARQ WorkerSettings with standard infrastructure.
@@ -166,10 +250,15 @@ def create_worker_settings(
         repo_class: Repository aggregator class
         service_class: Service aggregator class
         job_functions: List of async functions to register as jobs
-        dependencies: Dependency container with configs/pre-created deps
+        dependencies: Dependency container with configs/pre-created deps. Cap the ARQ
+            pool shared by all jobs with Dependencies(arq_max_connections=...) - it must
+            cover max_jobs concurrent enqueues, since redis-py raises instead of waiting
         cron_jobs: List of cron job definitions (optional)
         max_jobs: Maximum concurrent jobs (default: 10)
         job_timeout: Job timeout in seconds (default: 600)
+        db_pool_size: DB connection pool size (default: max_jobs + 5, so every
+            concurrent job gets a connection with headroom for nested sessions)
+        db_max_overflow: Extra connections allowed above the pool (default: 10)
 
     Returns:
         WorkerSettings class for ARQ
@@ -221,7 +310,11 @@ def create_worker_settings(
         ctx["producer"] = dependencies.get_producer()
 
         # Database
-        engine = create_engine(db_config)
+        engine = create_engine(
+            db_config,
+            pool_size=db_pool_size if db_pool_size is not None else max_jobs + 5,
+            max_overflow=db_max_overflow if db_max_overflow is not None else 10,
+        )
         session_pool = create_session_pool(engine)
         ctx["engine"] = engine
         ctx["session_pool"] = session_pool
@@ -229,17 +322,14 @@ def create_worker_settings(
         # Store classes and explicit factory for WorkerContext (type-safe)
         ctx["repo_class"] = repo_class
 
-        # Create explicit service factory (no magic, full type safety)
-        def service_factory(repo, bot):
-            return service_class(
-                repo=repo,
-                bot=bot,
-                arq=ctx["arq"],
-                redis=ctx["redis"],
-                producer=ctx["producer"],
-            )
-
-        ctx["service_factory"] = service_factory
+        # Explicit service factory with process-lifetime deps bound once;
+        # each transaction only supplies its own repo and the bot
+        ctx["service_factory"] = partial(
+            service_class,
+            arq=ctx["arq"],
+            redis=ctx["redis"],
+            producer=ctx["producer"],
+        )
 
     async def shutdown(ctx):
         """Cleanup worker context."""
@@ -1,10 +1,39 @@
 """Core database backup worker jobs."""
 
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+
+from aiogram.types import BufferedInputFile, FSInputFile
+
 from core.infrastructure.arq.factory import WorkerContext, inject_context
+from core.infrastructure.config import settings
 from core.infrastructure.logging import get_logger
+from core.scripts.common.backup_database import create_backup
 
 logger = get_logger(__name__)
 
+# Sends in flight per owner fan-out, well below Telegram's ~30 msg/s bot limit
+OWNER_SEND_CONCURRENCY = 5
+
+# Backups up to this size are read once and uploaded to every owner from memory
+# (Bot API uploads are capped at 50 MB anyway); larger files stream from disk per send
+BUFFERED_BACKUP_MAX_MB = 50
+
+
+async def _send_to_owners(send: Callable[[int], Awaitable], owner_ids: Iterable[int]) -> None:
+    """Run send(owner_id) for all owners concurrently, logging per-owner failures."""
+    semaphore = asyncio.Semaphore(OWNER_SEND_CONCURRENCY)
+
+    async def _send(owner_id: int) -> None:
+        async with semaphore:
+            try:
+                await send(owner_id)
+            except Exception as e:
+                logger.error(f"Failed to send backup message to owner {owner_id}: {e}")
+
+    await asyncio.gather(*(_send(owner_id) for owner_id in owner_ids))
+
 
 @inject_context
 async def backup_database_job(ctx: WorkerContext, requester_telegram_id: int):
@@ -14,11 +43,6 @@ async def backup_database_job(ctx: WorkerContext, requester_telegram_id: int):
     - NO transaction: Uses subprocess for pg_dump (external process)
     - NO transaction: Send via bot (external API)
     """
-    from aiogram.types import FSInputFile
-
-    from core.infrastructure.config import settings
-    from core.scripts.common.backup_database import create_backup
-
     logger.info(f"Job started: backup_database - Requester: {requester_telegram_id}")
 
     try:
@@ -79,15 +103,11 @@ async def scheduled_backup_job(ctx: WorkerContext):
     - NO transaction: Uses subprocess for pg_dump (external process)
     - NO transaction: Send via bot (external API)
     """
-    import asyncio
-
-    from aiogram.types import FSInputFile
-
-    from core.infrastructure.config import settings
-    from core.scripts.common.backup_database import create_backup
-
     logger.info("Job started: scheduled_backup")
 
+    # Snapshot once - shared by the success and both failure fan-outs
+    owner_ids = tuple(settings.rbac.owner_ids)
+
     try:
         # Create backup
         result = await create_backup(
@@ -99,11 +119,7 @@ async def scheduled_backup_job(ctx: WorkerContext):
         if not result.success:
             # Notify admins of failure
             error_msg = f"❌ Scheduled backup failed: {result.error}"
-            for owner_id in settings.rbac.owner_ids:
-                try:
-                    await ctx.bot.send_message(owner_id, error_msg)
-                except Exception:
-                    pass
+            await _send_to_owners(lambda owner_id: ctx.bot.send_message(owner_id, error_msg), owner_ids)
             logger.error(f"Job failed: scheduled_backup - {result.error}")
             return {"success": False, "error": result.error}
 
@@ -116,18 +132,25 @@ async def scheduled_backup_job(ctx: WorkerContext):
             f"⏱ Time: {result.duration_seconds:.1f}s"
         )
 
-        document = FSInputFile(result.file_path, filename=result.filename)
+        if result.size_mb <= BUFFERED_BACKUP_MAX_MB:
+            data = await asyncio.to_thread(Path(result.file_path).read_bytes)
+            document = BufferedInputFile(data, filename=result.filename)
+        else:
+            document = FSInputFile(result.file_path, filename=result.filename)
 
-        for owner_id in settings.rbac.owner_ids:
+        # Upload to the first owner that accepts it, then resend Telegram's file_id to the rest
+        for i, owner_id in enumerate(owner_ids):
             try:
-                await ctx.bot.send_document(
-                    chat_id=owner_id,
-                    document=document,
-                    caption=caption,
-                )
-                await asyncio.sleep(0.1)
+                message = await ctx.bot.send_document(chat_id=owner_id, document=document, caption=caption)
             except Exception as e:
-                logger.error(f"Failed to send backup to owner {owner_id}: {e}")
+                logger.error(f"Failed to send backup message to owner {owner_id}: {e}")
+                continue
+            file_id = message.document.file_id
+            await _send_to_owners(
+                lambda owner_id: ctx.bot.send_document(chat_id=owner_id, document=file_id, caption=caption),
+                owner_ids[i + 1 :],
+            )
+            break
 
         logger.info(f"Job completed: scheduled_backup - File: {result.filename}, Size: {result.size_mb:.2f}MB")
 
@@ -140,9 +163,6 @@ async def scheduled_backup_job(ctx: WorkerContext):
     except Exception as e:
         logger.error(f"Job failed: scheduled_backup - {e}", exc_info=True)
         # Try to notify admins
-        for owner_id in settings.rbac.owner_ids:
-            try:
-                await ctx.bot.send_message(owner_id, f"❌ Scheduled backup failed: {str(e)}")
-            except Exception:
-                pass
+        error_msg = f"❌ Scheduled backup failed: {str(e)}"
+        await _send_to_owners(lambda owner_id: ctx.bot.send_message(owner_id, error_msg), owner_ids)
         raise
@@ -15,7 +15,7 @@ import hashlib
 import hmac
 import json
 from json import JSONDecodeError
-from urllib.parse import parse_qsl, unquote
+from urllib.parse import parse_qsl
 
 
 @dataclasses.dataclass
@@ -83,21 +83,21 @@ class TelegramAuthenticator:
         self._secret = secret
 
     @staticmethod
-    def _parse_init_data(data: str) -> dict:
-        """Convert init_data string into dictionary.
+    def _parse_init_data(data: str) -> list[tuple[str, str]]:
+        """Split init_data string into (key, value) pairs sorted by key.
 
         Args:
             data: The query string passed by the webapp
 
         Returns:
-            dict: Parsed init_data
+            list[tuple[str, str]]: Unquoted pairs, blank values kept (Telegram signs every field)
 
         Raises:
             InvalidInitDataError: If data is empty or invalid
         """
         if not data:
             raise InvalidInitDataError("Init Data cannot be empty")
-        return dict(parse_qsl(data))
+        return sorted(parse_qsl(data, keep_blank_values=True))
 
     @staticmethod
     def _parse_user_data(data: str) -> dict:
@@ -107,7 +107,7 @@ class TelegramAuthenticator:
             https://core.telegram.org/bots/webapps#webappinitdata
 
         Args:
-            data: URL-encoded JSON string with user data
+            data: JSON string with user data (already unquoted by parse_qsl)
 
         Returns:
             dict: Parsed user data
@@ -116,7 +116,7 @@ class TelegramAuthenticator:
             InvalidInitDataError: If data cannot be decoded
         """
         try:
-            return json.loads(unquote(data))
+            return json.loads(data)
         except JSONDecodeError:
             raise InvalidInitDataError("Cannot decode init data")
 
@@ -136,7 +136,7 @@ class TelegramAuthenticator:
             bool: Validation result
         """
         token_bytes = token.encode("utf-8")
-        client_hash = hmac.new(self._secret, token_bytes, hashlib.sha256).hexdigest()
+        client_hash = hmac.digest(self._secret, token_bytes, hashlib.sha256).hex()
         return hmac.compare_digest(client_hash, hash_)
 
     def verify_token(self, token: str) -> TelegramUser:
@@ -154,25 +154,29 @@ class TelegramAuthenticator:
         Raises:
             InvalidInitDataError: If the token is invalid or missing required fields
         """
-        init_data = self._parse_init_data(token)
-        token = "\n".join(
-            f"{key}={val}" for key, val in sorted(init_data.items(), key=lambda item: item[0]) if key != "hash"
-        )
-        token = unquote(token)
-        hash_ = init_data.get("hash")
+        # Single pass over the sorted pairs: pull out hash and user, collect the rest for the check string.
+        # parse_qsl already unquoted the values; unquoting again would corrupt literal "%xx" sequences
+        hash_ = user_data = None
+        check_parts = []
+        for key, val in self._parse_init_data(token):
+            if key == "hash":
+                hash_ = val
+                continue
+            if key == "user":
+                user_data = val
+            check_parts.append(f"{key}={val}")
+
         if not hash_:
             raise InvalidInitDataError("Init data does not contain hash")
 
         hash_ = hash_.strip()
 
-        if not self._validate(hash_, token):
+        if not self._validate(hash_, "\n".join(check_parts)):
             raise InvalidInitDataError("Invalid token")
 
-        user_data = init_data.get("user")
         if not user_data:
             raise InvalidInitDataError("Init data does not contain user")
 
-        user_data = unquote(user_data)
         user_data = self._parse_user_data(user_data)
         return TelegramUser(**user_data)
 
@@ -6,7 +6,9 @@ These are BaseModel (NOT BaseSettings) - the parent Settings class handles
 env var loading. Components just define the shape of nested config objects.
 """
 
-from pydantic import BaseModel
+from typing import Self
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr, model_validator
 
 
 class DatabaseSettings(BaseModel):
@@ -65,7 +67,7 @@ class SessionSettings(BaseModel):
 
     Env vars: SESSION__EXPIRE_DAYS, SESSION__COOKIE_SECURE, etc.
 
-    Note: cookie_name and key_prefix are derived from app_name
+    Note: cookie_name, key_prefix and user_index_prefix are derived from app_name
     and should be set in model_post_init of the root Settings.
     """
 
@@ -77,6 +79,7 @@ class SessionSettings(BaseModel):
     # Derived fields - set by root Settings
     cookie_name: str = ""
     key_prefix: str = ""
+    user_index_prefix: str = ""  # Redis set of a user's session ids: f"{user_index_prefix}{user_id}"
 
 
 class BotSettings(BaseModel):
@@ -181,4 +184,19 @@ class RBACSettings(BaseModel):
     Env vars: RBAC__OWNER_IDS
     """
 
-    owner_ids: list[int] = []  # Telegram IDs that are always treated as owner
+    # Re-run the validator below when owner_ids is reassigned (including monkeypatch in tests)
+    model_config = ConfigDict(validate_assignment=True)
+
+    owner_ids: list[int] = []  # Telegram IDs that are always treated as owner (ordered)
+
+    _owner_ids_set: frozenset[int] = PrivateAttr(default=frozenset())
+
+    @model_validator(mode="after")
+    def _build_owner_ids_set(self) -> Self:
+        self._owner_ids_set = frozenset(self.owner_ids)
+        return self
+
+    @property
+    def owner_ids_set(self) -> frozenset[int]:
+        """owner_ids as a frozenset for O(1) membership checks, built at load and on reassignment."""
+        return self._owner_ids_set
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from uuid import UUID, uuid7
 
-from sqlalchemy import BIGINT, Boolean, Date, Enum, Integer, String
+from sqlalchemy import BIGINT, Boolean, Date, Enum, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -34,7 +34,7 @@ class User(Base, CreatedAtMixin, UpdatedAtMixin, TableNameMixin):
     telegram_id: Mapped[int | None] = mapped_column(BIGINT, unique=True, nullable=True)
     tg_first_name: Mapped[str | None] = mapped_column(String(64), nullable=True)
     tg_last_name: Mapped[str | None] = mapped_column(String(64))
-    tg_username: Mapped[str | None] = mapped_column(String(32))
+    tg_username: Mapped[str | None] = mapped_column(String(32), index=True)  # Telegram code login
     tg_language_code: Mapped[str | None] = mapped_column(String(8))
     tg_is_premium: Mapped[bool | None] = mapped_column(Boolean)
     tg_photo_url: Mapped[str | None] = mapped_column(String(500))
@@ -71,6 +71,9 @@ class User(Base, CreatedAtMixin, UpdatedAtMixin, TableNameMixin):
     payments: Mapped[list[Payment]] = relationship("Payment", back_populates="user")
     subscriptions: Mapped[list[Subscription]] = relationship("Subscription", back_populates="user")
 
+    # Username login matches case-insensitively (UserRepo.get_by_username)
+    __table_args__ = (Index("ix_users_username_lower", text("lower(username)")),)
+
     def __repr__(self):
         return f"<User {self.id} {self.username} ({self.user_type.value})>"
 
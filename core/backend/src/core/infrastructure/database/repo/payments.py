@@ -111,6 +111,47 @@ class PaymentRepo(BaseRepo):
         result = await self.session.execute(stmt)
         return {product_id: int(count) for product_id, count in result.all()}
 
+    async def get_revenue_and_sales_stats(self, from_dt, to_dt=None) -> dict[str, dict]:
+        """Get all-time and in-range revenue and product sales in two queries.
+
+        Returns {"revenue": {"alltime", "today"}, "product_sales": {"alltime", "today"}},
+        where "today" only lists currencies/products with payments between the dates.
+        """
+        to_dt = to_dt if to_dt else datetime.now(UTC)
+        in_range = and_(self.model_type.created_at >= from_dt, self.model_type.created_at <= to_dt)
+
+        revenue_stmt = (
+            select(
+                self.model_type.currency,
+                func.sum(self.model_type.amount),
+                func.sum(self.model_type.amount).filter(in_range),
+            )
+            .where(self.model_type.status == PaymentStatus.SUCCEEDED)
+            .group_by(self.model_type.currency)
+        )
+        sales_stmt = (
+            select(
+                self.model_type.product_id,
+                func.count(),
+                func.count().filter(in_range),
+            )
+            .where(self.model_type.status == PaymentStatus.SUCCEEDED)
+            .group_by(self.model_type.product_id)
+        )
+
+        revenue_rows = (await self.session.execute(revenue_stmt)).all()
+        sales_rows = (await self.session.execute(sales_stmt)).all()
+        return {
+            "revenue": {
+                "alltime": {currency: float(total) for currency, total, _ in revenue_rows},
+                "today": {currency: float(today) for currency, _, today in revenue_rows if today is not None},
+            },
+            "product_sales": {
+                "alltime": {product_id: int(total) for product_id, total, _ in sales_rows},
+                "today": {product_id: int(today) for product_id, _, today in sales_rows if today},
+            },
+        }
+
 
 class PaymentEventRepo(BaseRepo):
     def __init__(self, session):
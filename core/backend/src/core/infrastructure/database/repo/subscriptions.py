@@ -1,7 +1,8 @@
-from datetime import UTC, datetime
-from uuid import UUID
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import exists, func, insert, literal, or_, select, union_all, update
+from sqlalchemy.orm import aliased
 
 from core.infrastructure.database.models.subscriptions import (
     Subscription,
@@ -34,6 +35,60 @@ class SubscriptionRepo(BaseRepo):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def extend_or_create(self, user_id: UUID, duration: timedelta, create_data: dict) -> Subscription:
+        """Extend the user's live subscription by `duration`, or create one, in a single statement.
+
+        The user's live subscription (ACTIVE or CANCELED, not yet ended; the latest-ending
+        one if there are several) gets `duration` added to its end date and is reactivated. Otherwise a new row starting now is inserted from
+        `create_data` (product_id, provider_id, status, currency, recurring_details).
+
+        Both branches run as data-modifying CTEs of one query, so this is one round-trip.
+        Uses flush semantics like BaseRepo - transaction is managed at the caller level.
+        """
+        model = self.model_type
+        now = datetime.now(UTC)
+
+        # Only the latest-ending live row is extended, even if the payment path left several
+        latest_live = (
+            select(model.id)
+            .where(
+                (model.user_id == user_id)
+                & model.status.in_([SubscriptionStatus.ACTIVE, SubscriptionStatus.CANCELED])
+                & (model.end_date > now)
+            )
+            .order_by(model.end_date.desc())
+            .limit(1)
+            .with_for_update()
+            .scalar_subquery()
+        )
+        extended = (
+            update(model)
+            .where(model.id == latest_live)
+            .values(end_date=model.end_date + duration, status=SubscriptionStatus.ACTIVE)
+            .returning(*model.__table__.c)
+            .cte("extended")
+        )
+
+        row = {"id": uuid4(), "user_id": user_id, "start_date": now, "end_date": now + duration, **create_data}
+        columns = model.__table__.c
+        created = (
+            insert(model)
+            .from_select(
+                list(row),
+                select(*(literal(value, columns[name].type) for name, value in row.items())).where(
+                    ~exists(extended.select())
+                ),
+            )
+            .returning(*model.__table__.c)
+            .cte("created")
+        )
+
+        # Read the rows back from RETURNING: the CTEs' writes aren't visible to a plain SELECT here
+        subscription = aliased(model, union_all(select(extended), select(created)).subquery())
+        stmt = select(subscription).execution_options(populate_existing=True)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
     async def get_expiring_subscriptions(self, expiration_threshold: datetime) -> list[Subscription]:
         stmt = select(self.model_type).where(
             (self.model_type.status == SubscriptionStatus.ACTIVE) & (self.model_type.end_date <= expiration_threshold)
@@ -1,8 +1,10 @@
+from collections.abc import Iterable
 from datetime import UTC, datetime
-from uuid import UUID
+from uuid import UUID, uuid7
 
-from sqlalchemy import and_, exists, extract, func, or_, select, text, update
+from sqlalchemy import and_, exists, extract, func, or_, select, text, union_all, update
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
 
 from core.infrastructure.database.models import Friendship, User
 from core.infrastructure.database.repo.base import BaseRepo
@@ -73,6 +75,43 @@ class UserRepo(BaseRepo):
         await self.session.refresh(user)
         return user
 
+    async def upsert_by_telegram_id(self, user_data: dict, update_fields: Iterable[str]) -> User:
+        """Insert a Telegram user or refresh its TG fields, in a single statement.
+
+        On telegram_id conflict only `update_fields` present in `user_data` are overwritten,
+        and only if one of them actually changed - an unchanged user costs no write and keeps
+        its updated_at. The row comes back from RETURNING or, when nothing was written, from
+        a fallback SELECT in the same query.
+        :param dict user_data: User data, must contain telegram_id.
+        :param update_fields: Columns refreshed from `user_data` for an existing user.
+        :return: User object.
+        """
+        telegram_id = user_data["telegram_id"]
+        insert_data = {k: v for k, v in user_data.items() if v is not None}
+        updates = {field: user_data[field] for field in update_fields if field in user_data}
+
+        stmt = insert(User).values(
+            id=uuid7(), **insert_data, created_at=text("CURRENT_TIMESTAMP"), updated_at=text("CURRENT_TIMESTAMP")
+        )
+        if updates:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.telegram_id],
+                set_=dict(**updates, updated_at=text("CURRENT_TIMESTAMP")),
+                where=or_(*(getattr(User, field).is_distinct_from(value) for field, value in updates.items())),
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[User.telegram_id])
+        upserted = stmt.returning(*User.__table__.c).cte("upserted")
+        existing = select(*User.__table__.c).where(User.telegram_id == telegram_id, ~exists(upserted.select()))
+
+        user = aliased(User, union_all(select(upserted), existing).subquery())
+        result = await self.session.execute(select(user).execution_options(populate_existing=True))
+        db_user = result.scalar_one_or_none()
+        if db_user is None:
+            # Lost a race with a concurrent first login: its row is newer than this statement's snapshot
+            db_user = await self.get_by_telegram_id(telegram_id)
+        return db_user
+
     async def update_user(self, user_id: UUID, user_data: dict) -> User:
         """Update user and return updated user object.
 
@@ -176,6 +215,28 @@ class UserRepo(BaseRepo):
         """Get count of users updated between dates"""
         return await self._get_count_between(User.updated_at, from_dt, to_dt)
 
+    async def get_activity_counts(self, today_start, week_start, month_start, to_dt=None) -> dict[str, int]:
+        """Get total, new and active user counts for the daily report in one query.
+
+        Keys: total, new_today, new_this_week, new_this_month, dau, wau, mau.
+        """
+        to_dt = to_dt if to_dt else datetime.now(UTC)
+
+        def count_since(column, from_dt):
+            return func.count().filter(column >= from_dt, column <= to_dt)
+
+        stmt = select(
+            func.count().label("total"),
+            count_since(User.created_at, today_start).label("new_today"),
+            count_since(User.created_at, week_start).label("new_this_week"),
+            count_since(User.created_at, month_start).label("new_this_month"),
+            count_since(User.updated_at, today_start).label("dau"),
+            count_since(User.updated_at, week_start).label("wau"),
+            count_since(User.updated_at, month_start).label("mau"),
+        ).select_from(User)
+        result = await self.session.execute(stmt)
+        return result.one()._asdict()
+
     async def get_by_verified_email(self, email: str) -> User | None:
         """
         Get user by verified email address.
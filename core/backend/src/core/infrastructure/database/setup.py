@@ -1,15 +1,17 @@
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 
-def create_engine(db, echo=False):
+def create_engine(db, echo=False, pool_size=20, max_overflow=40):
     engine = create_async_engine(
         db.url,
         query_cache_size=1200,
-        pool_size=20,
-        max_overflow=200,
+        pool_size=pool_size,
+        max_overflow=max_overflow,  # Bounded burst: pool_size + overflow per process must fit Postgres max_connections
         pool_timeout=30,  # Timeout for getting a connection from the pool
         pool_recycle=1800,  # Recycle connections after 30 minutes
         pool_pre_ping=True,  # Verify connections before using them
+        # asyncpg prepared statements kept per connection (SQLAlchemy default 100): hot ORM queries skip parse/plan
+        connect_args={"prepared_statement_cache_size": 500},
         future=True,
         echo=echo,
     )
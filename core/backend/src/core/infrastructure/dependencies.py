@@ -62,6 +62,9 @@ class Dependencies:
         arq: Pre-created ARQ pool (optional, created lazily if not provided)
         redis: Pre-created Redis client (optional, created lazily if not provided)
         producer: Pre-created RabbitMQ producer (optional, created lazily if not provided)
+        arq_max_connections: Connection cap for the lazily created ARQ pool (optional, unbounded
+            by default; redis-py raises rather than waits once the cap is reached). Not applied
+            to a pre-created arq pool - size that one where it is created
     """
 
     redis_config: RedisConfig | None = None
@@ -71,6 +74,8 @@ class Dependencies:
     redis: RedisClient | None = None
     producer: RabbitMQProducer | None = None
 
+    arq_max_connections: int | None = None
+
     _created: dict[str, ArqRedis | RedisClient | RabbitMQProducer] = field(default_factory=dict, init=False, repr=False)
 
     async def get_arq(self) -> ArqRedis:
@@ -90,6 +95,7 @@ class Dependencies:
                     host=self.redis_config.host,
                     port=self.redis_config.port,
                     password=self.redis_config.password or None,
+                    max_connections=self.arq_max_connections,
                 )
             )
 
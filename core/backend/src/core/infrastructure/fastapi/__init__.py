@@ -3,11 +3,13 @@
 from core.infrastructure.fastapi import dependencies
 from core.infrastructure.fastapi.factory import create_api
 from core.infrastructure.fastapi.middleware import CachedStaticFiles, SecurityConfig, SecurityHeadersMiddleware
+from core.infrastructure.fastapi.responses import PydanticJSONResponse
 
 __all__ = [
     "create_api",
     "dependencies",
     "CachedStaticFiles",
+    "PydanticJSONResponse",
     "SecurityConfig",
     "SecurityHeadersMiddleware",
 ]
@@ -49,6 +49,7 @@ def create_api(
     security_csp: str | None = None,
     root_path: str = "",
     on_startup: list | None = None,
+    on_shutdown: list | None = None,
 ) -> FastAPI:
     """
     Create fully-configured FastAPI app with standard infrastructure.
@@ -72,6 +73,7 @@ def create_api(
         security_csp: Content Security Policy string (optional, defaults to strict)
         root_path: Root path for reverse proxy setups (optional)
         on_startup: List of async callbacks to run on startup (optional)
+        on_shutdown: List of async no-arg callbacks to run after requests drain (optional)
 
     Returns:
         FastAPI app ready to serve
@@ -163,11 +165,16 @@ def create_api(
                 f"  ⚠  Drain timeout after {drain_timeout}s, {request_tracker.active_count} requests still active"
             )
 
-        # 3. Close Redis connections
+        # 3. Run app-specific shutdown callbacks
+        if on_shutdown:
+            for callback in on_shutdown:
+                await callback()
+
+        # 4. Close Redis connections
         await RedisClient.close()
         logger.info("  ✓ Redis connections closed")
 
-        # 4. Close database connections
+        # 5. Close database connections
         await engine.dispose()
         logger.info("  ✓ Database connections closed")
 
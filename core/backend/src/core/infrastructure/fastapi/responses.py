@@ -0,0 +1,17 @@
+"""Response classes."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSONResponse rendered by pydantic-core's Rust serializer instead of stdlib json.
+
+    Output matches JSONResponse (compact separators, raw UTF-8), except that
+    NaN/Infinity are written as null instead of raising.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
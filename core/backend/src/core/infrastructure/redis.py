@@ -37,13 +37,13 @@ class RedisClient:
         client = await self.get_client()
         return await client.get(key)
 
-    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+    async def set(self, key: str, value: str | bytes, ex: int | None = None) -> bool:
         client = await self.get_client()
         return await client.set(key, value, ex=ex)
 
-    async def delete(self, key: str) -> bool:
+    async def delete(self, *keys: str) -> int:
         client = await self.get_client()
-        return await client.delete(key)
+        return await client.delete(*keys)
 
     async def exists(self, key: str) -> int:
         """Check if a key exists in Redis."""
@@ -55,11 +55,67 @@ class RedisClient:
         client = await self.get_client()
         return await client.incr(key)
 
+    async def incrby(self, key: str, amount: int, ex: int | None = None) -> int:
+        """Increment a key's value by amount, refreshing its TTL to ex in the same round-trip."""
+        client = await self.get_client()
+        if ex is None:
+            return await client.incrby(key, amount)
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.incrby(key, amount)
+            pipe.expire(key, ex)
+            value, _ = await pipe.execute()
+        return value
+
     async def expire(self, key: str, seconds: int) -> bool:
         """Set a TTL on a key in seconds."""
         client = await self.get_client()
         return await client.expire(key, seconds)
 
+    async def ttl(self, key: str) -> int:
+        """Get remaining TTL in seconds (-1 if no expiry, -2 if missing)."""
+        client = await self.get_client()
+        return await client.ttl(key)
+
+    async def get_with_ttl(self, key: str) -> tuple[bytes | None, int]:
+        """Get a key's value and remaining TTL in a single round-trip."""
+        client = await self.get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.ttl(key)
+            value, ttl = await pipe.execute()
+        return value, ttl
+
+    async def set_and_index(self, key: str, value: str | bytes, ex: int, index_key: str, member: str) -> None:
+        """SET key and add member to the index set (TTL refreshed to ex) in one round-trip."""
+        client = await self.get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set(key, value, ex=ex)
+            pipe.sadd(index_key, member)
+            pipe.expire(index_key, ex)
+            await pipe.execute()
+
+    async def expire_with_index(self, key: str, seconds: int, index_key: str) -> None:
+        """EXPIRE key and its index set in one round-trip."""
+        client = await self.get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.expire(key, seconds)
+            pipe.expire(index_key, seconds)
+            await pipe.execute()
+
+    async def delete_and_unindex(self, keys: list[str], index_key: str, member: str) -> int:
+        """DEL keys and remove member from the index set in one round-trip."""
+        client = await self.get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.delete(*keys)
+            pipe.srem(index_key, member)
+            deleted, _ = await pipe.execute()
+        return deleted
+
+    async def smembers(self, key: str) -> list[bytes]:
+        """Get all members of a set."""
+        client = await self.get_client()
+        return list(await client.smembers(key))
+
     async def flushdb(self) -> bool:
         """Delete all keys in the current database."""
         client = await self.get_client()
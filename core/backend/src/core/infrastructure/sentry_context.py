@@ -22,7 +22,9 @@ def set_sentry_user(
     # Set in request context (for logs)
     set_user_context(user_id)
 
-    # Set in Sentry
+    # Set in Sentry (skipped when it was never initialized: nothing would read the scope)
+    if not sentry_sdk.get_client().is_active():
+        return
     sentry_sdk.set_user(
         {
             "id": user_id,
@@ -1,6 +1,7 @@
 """Socket.IO infrastructure."""
 
 from .factory import create_socketio
+from .rooms import room_size
 from .types import SocketIOConfig
 
-__all__ = ["create_socketio", "SocketIOConfig"]
+__all__ = ["create_socketio", "room_size", "SocketIOConfig"]
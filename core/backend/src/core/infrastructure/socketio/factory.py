@@ -2,6 +2,7 @@
 
 import socketio
 
+from . import serializer
 from .types import SocketIOConfig
 
 
@@ -27,13 +28,19 @@ def create_socketio(
     """
     cfg = config or SocketIOConfig()
 
+    client_manager = None
+    if cfg.redis_url:
+        client_manager = socketio.AsyncRedisManager(cfg.redis_url, channel=cfg.redis_channel)
+
     sio = socketio.AsyncServer(
+        client_manager=client_manager,
         async_mode=cfg.async_mode,
         cors_allowed_origins=cfg.cors_origins,
         logger=cfg.logger,
         engineio_logger=cfg.logger,
         ping_timeout=cfg.ping_timeout,
         ping_interval=cfg.ping_interval,
+        json=serializer,
     )
 
     # socketio_path="" because caller mounts at /socket.io
@@ -0,0 +1,12 @@
+"""Socket.IO room helpers."""
+
+import socketio
+
+
+def room_size(sio: socketio.AsyncServer, room: str, namespace: str = "/") -> int:
+    """Count clients in a room without materializing the participant list.
+
+    Prefer a counter maintained in connect/disconnect handlers on hot paths;
+    this is for diagnostics and rooms whose membership isn't tracked.
+    """
+    return sum(1 for _ in sio.manager.get_participants(namespace, room))
@@ -0,0 +1,19 @@
+"""JSON module for Socket.IO packets backed by pydantic-core.
+
+python-socketio accepts any module exposing dumps/loads as its JSON codec.
+pydantic-core is already a dependency and encodes faster than stdlib json.
+"""
+
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+
+def dumps(obj: Any, **kwargs: Any) -> str:
+    """Encode obj as compact JSON (separators and other stdlib kwargs are ignored)."""
+    return to_json(obj).decode()
+
+
+def loads(s: str | bytes, **kwargs: Any) -> Any:
+    """Decode a JSON document."""
+    return from_json(s)
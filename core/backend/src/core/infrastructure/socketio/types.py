@@ -12,3 +12,6 @@ class SocketIOConfig:
     logger: bool = False
     ping_timeout: int = 20
     ping_interval: int = 25
+    # Redis URL for cross-worker fan-out; None keeps rooms in-process
+    redis_url: str | None = None
+    redis_channel: str = "socketio"
@@ -18,7 +18,7 @@ logger = get_logger(__name__)
 async def backup_command(message: types.Message, user: UserSchema, services: CoreRequestsService):
     """Handler for /backup command. Creates database backup and sends it to the admin."""
     # Check if user is admin
-    if not user.telegram_id or user.telegram_id not in settings.rbac.owner_ids:
+    if not user.telegram_id or user.telegram_id not in settings.rbac.owner_ids_set:
         await message.answer("You don't have permission to use this command")
         return
 
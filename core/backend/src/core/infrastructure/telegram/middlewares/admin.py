@@ -53,7 +53,7 @@ class AdminMiddleware(BaseMiddleware):
         owner_ids: list[int],
         unauthorized_msg: str = "You don't have permission to use this command",
     ):
-        self.owner_ids = owner_ids
+        self.owner_ids = frozenset(owner_ids)
         self.unauthorized_msg = unauthorized_msg
 
     async def __call__(
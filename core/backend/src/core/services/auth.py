@@ -195,11 +195,12 @@ class AuthService(BaseService):
             code = self._generate_auth_code()
 
             code_key = f"{AUTH_CODE_PREFIX}{clean_username}"
+            now = datetime.now(UTC)
             code_data = {
                 "code": code,
                 "user_id": user.id,
-                "created_at": datetime.now(UTC).isoformat(),
-                "expires_at": (datetime.now(UTC) + timedelta(minutes=AUTH_CODE_EXPIRY_MINUTES)).isoformat(),
+                "created_at": now.isoformat(),
+                "expires_at": (now + timedelta(minutes=AUTH_CODE_EXPIRY_MINUTES)).isoformat(),
             }
 
             await self.redis.set(code_key, json.dumps(code_data), ex=AUTH_CODE_EXPIRY_MINUTES * 60)
@@ -8,26 +8,42 @@ Session lifecycle:
 - CREATE: Generate UUID session ID, store data in Redis with TTL
 - VALIDATE: Retrieve session, update last_accessed, extend TTL
 - DESTROY: Remove session from Redis
+
+Each session id is also indexed in a per-user set (settings.session.user_index_prefix)
+so all of a user's sessions can be found, e.g. for "log out everywhere".
 """
 
-import json
+import time
 import uuid
-from datetime import UTC, datetime
 from typing import Protocol
 from uuid import UUID
 
+from pydantic_core import from_json, to_json
+
 from core.infrastructure.config import settings
 from core.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Resolved UserSchema cached next to each session so authenticated requests can skip the DB.
+# Short TTL bounds staleness for writes that don't go through UserService.update_user.
+SESSION_USER_CACHE_TTL_SECONDS = 30
+
+
+def session_user_cache_key(session_key: str) -> str:
+    """Redis key holding the cached user for a session key."""
+    return f"{session_key}:user"
+
 
 class RedisProtocol(Protocol):
     """Redis client protocol for type checking."""
 
-    async def set(self, key: str, value: str, ex: int) -> None: ...
+    async def set(self, key: str, value: str | bytes, ex: int) -> None: ...
     async def get(self, key: str) -> bytes | None: ...
-    async def delete(self, key: str) -> int: ...
+    async def delete(self, *keys: str) -> int: ...
+    async def smembers(self, key: str) -> list[bytes]: ...
+    async def set_and_index(self, key: str, value: str | bytes, ex: int, index_key: str, member: str) -> None: ...
+    async def delete_and_unindex(self, keys: list[str], index_key: str, member: str) -> int: ...
 
 
 class SessionService:
@@ -91,18 +107,25 @@ class SessionService:
         session_id = str(uuid.uuid4())
         session_key = f"{settings.session.key_prefix}{session_id}"
 
+        now = time.time()
         session_data = {
-            "user_id": str(user_id),
+            "user_id": user_id,  # serialized as its string form
             "user_type": user_type,
-            "created_at": datetime.now(UTC).isoformat(),
-            "last_accessed": datetime.now(UTC).isoformat(),
+            "created_at": now,  # unix epoch seconds
+            "last_accessed": now,
         }
 
         if metadata:
             session_data.update(metadata)
 
         expire_seconds = settings.session.expire_days * 24 * 60 * 60
-        await self.redis.set(session_key, json.dumps(session_data), ex=expire_seconds)
+        await self.redis.set_and_index(
+            session_key,
+            to_json(session_data),
+            ex=expire_seconds,
+            index_key=f"{settings.session.user_index_prefix}{user_id}",
+            member=session_id,
+        )
 
         logger.info(f"Created session {session_id} for user {user_id} with prefix {settings.session.key_prefix}")
         return session_id
@@ -111,7 +134,7 @@ class SessionService:
         """Validate session and return session data.
 
         Retrieves session data from Redis, updates last_accessed time,
-        and extends TTL.
+        and extends the TTL of the session and of the user's session index.
 
         Args:
             session_id: Session identifier
@@ -129,21 +152,23 @@ class SessionService:
             if not session_data_raw:
                 return None
 
-            # Handle bytes from Redis
-            if isinstance(session_data_raw, bytes):
-                session_data_raw = session_data_raw.decode("utf-8")
+            session_data = from_json(session_data_raw)
 
-            session_data = json.loads(session_data_raw)
-
-            # Update last accessed time and extend TTL
-            session_data["last_accessed"] = datetime.now(UTC).isoformat()
+            # Update last accessed time and extend TTL (of the user's session index too)
+            session_data["last_accessed"] = time.time()
             expire_seconds = settings.session.expire_days * 24 * 60 * 60
 
-            await self.redis.set(session_key, json.dumps(session_data), ex=expire_seconds)
+            await self.redis.set_and_index(
+                session_key,
+                to_json(session_data),
+                ex=expire_seconds,
+                index_key=f"{settings.session.user_index_prefix}{session_data['user_id']}",
+                member=session_id,
+            )
 
             return session_data
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError) as e:
             logger.warning(f"Invalid session data for {session_id}: {e}")
             return None
         except Exception as e:
@@ -165,9 +190,32 @@ class SessionService:
         session_key = f"{settings.session.key_prefix}{session_id}"
 
         try:
-            result = await self.redis.delete(session_key)
+            session_data_raw = await self.redis.get(session_key)
+            if not session_data_raw:
+                return False
+
+            user_id = from_json(session_data_raw).get("user_id")
+            result = await self.redis.delete_and_unindex(
+                [session_key, session_user_cache_key(session_key)],
+                index_key=f"{settings.session.user_index_prefix}{user_id}",
+                member=session_id,
+            )
             logger.info(f"Destroyed session {session_id}")
             return bool(result)
         except Exception as e:
             logger.error(f"Error destroying session {session_id}: {e}")
             return False
+
+    async def invalidate_user_cache(self, user_id: UUID) -> None:
+        """Drop the cached user of every session belonging to user_id (after the user changes)."""
+        if self.redis is None:
+            return
+
+        try:
+            session_ids = await self.redis.smembers(f"{settings.session.user_index_prefix}{user_id}")
+            if session_ids:
+                await self.redis.delete(
+                    *(session_user_cache_key(f"{settings.session.key_prefix}{sid.decode()}") for sid in session_ids)
+                )
+        except Exception as e:
+            logger.error(f"Error invalidating cached user {user_id}: {e}")
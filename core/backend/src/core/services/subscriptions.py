@@ -80,6 +80,26 @@ class SubscriptionsService(BaseService):
             subscription.status == SubscriptionStatus.ACTIVE or subscription.status == SubscriptionStatus.CANCELED
         )
 
+    async def gift_or_extend(self, user_id: UUID, duration_days: int, gifted_by: UUID) -> SubscriptionSchema:
+        """Gift `duration_days` of subscription: extends a live subscription or creates a GIFT_SUB one.
+
+        Locks the recipient's user row first, so concurrent gifts to the same user queue up
+        in the database until the caller's transaction commits (the create branch included).
+        """
+        await self.repo.users.get_by_id_with_lock(user_id)
+        subscription = await self.repo.subscriptions.extend_or_create(
+            user_id,
+            timedelta(days=duration_days),
+            {
+                "product_id": "GIFT_SUB",
+                "provider_id": PaymentProvider.GIFT,
+                "status": SubscriptionStatus.ACTIVE,
+                "currency": "RUB",
+                "recurring_details": {"gifted_by": str(gifted_by)},
+            },
+        )
+        return SubscriptionSchema.model_validate(subscription)
+
     # INSIDE PAYMENT SERVICE
     async def top_up_subscription(self, user_id, product_id, duration_days, payment: Payment, recurring_details: dict):
         logger.info(
@@ -55,6 +55,17 @@ class UserService(BaseService):
         user = await self.repo.users.get_or_create_user(data)
         return UserSchema.model_validate(user)
 
+    async def upsert_by_telegram_id(self, user_data: UserSchema) -> UserSchema:
+        """
+        Get or create a Telegram user in one round-trip.
+
+        Same outcome as get_or_create_user: changed TG fields are refreshed, app profile
+        fields are only used on first insert, and an unchanged user is not written.
+        """
+        data = user_data.model_dump(exclude_unset=True)
+        user = await self.repo.users.upsert_by_telegram_id(data, self._TG_UPDATABLE_FIELDS)
+        return UserSchema.model_validate(user)
+
     def _get_telegram_field_updates(self, existing, new_data: dict) -> dict:
         """Compare TG fields and return only changed ones."""
         updates = {}
@@ -117,6 +128,7 @@ class UserService(BaseService):
 
         # Update user and return updated schema
         updated_user = await self.repo.users.update_user(user_id, update_data)
+        await self.services.sessions.invalidate_user_cache(user_id)
         return UserSchema.model_validate(updated_user)
 
     async def get_by_telegram_id(self, telegram_id: int) -> UserSchema | None:
@@ -16,6 +16,7 @@ from core.infrastructure.config import settings
 from core.testing.fixtures.auth import generate_telegram_init_data
 
 
+@pytest.mark.asyncio
 class BaseAuthTests:
     """Base class for auth contract tests. Apps inherit and provide fixtures."""
 
@@ -12,6 +12,7 @@ import pytest
 from httpx import AsyncClient
 
 
+@pytest.mark.asyncio
 class BaseHealthTests:
     """Base class for health endpoint contract tests."""
 
@@ -13,6 +13,7 @@ import pytest
 from httpx import AsyncClient
 
 
+@pytest.mark.asyncio
 class BasePaymentTests:
     """Base class for payment/subscription contract tests."""
 
@@ -15,6 +15,7 @@ from core.infrastructure.config import settings
 from core.testing.fixtures.auth import generate_telegram_init_data
 
 
+@pytest.mark.asyncio
 class BaseUserTests:
     """Base class for user endpoint contract tests."""
 
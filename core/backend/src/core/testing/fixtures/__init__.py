@@ -34,6 +34,7 @@ from core.testing.fixtures.redis import InMemoryRedis, mock_redis
 # Worker
 from core.testing.fixtures.worker import (
     CapturedMessage,
+    FailingBot,
     MockBot,
     captured_bot_messages,
     captured_bot_photos,
@@ -69,6 +70,7 @@ __all__ = [
     "callback_query_factory",
     # Worker
     "MockBot",
+    "FailingBot",
     "CapturedMessage",
     "worker_mock_bot",
     "captured_bot_messages",
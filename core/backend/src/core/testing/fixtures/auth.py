@@ -3,9 +3,16 @@
 import hashlib
 import hmac
 import json
+from functools import cache
 from urllib.parse import urlencode
 
 
+@cache
+def _webapp_secret_key(bot_token: str) -> bytes:
+    """Derive Telegram's WebAppData secret key for a bot token (once per token)."""
+    return hmac.digest(b"WebAppData", bot_token.encode(), hashlib.sha256)
+
+
 def generate_telegram_init_data(
     user_id: int,
     username: str,
@@ -53,15 +60,16 @@ def generate_telegram_init_data(
 
     # Build data_check_string (alphabetically sorted, newline-separated)
     # This MUST match Telegram's algorithm exactly
+    user_json = json.dumps(user_data, separators=(",", ":"))
     data_check_string_parts = [
         f"auth_date={auth_date}",
-        f"user={json.dumps(user_data, separators=(',', ':'))}",
+        f"user={user_json}",
     ]
     data_check_string = "\n".join(sorted(data_check_string_parts))
 
     # Generate HMAC hash using same algorithm as Telegram
     # Step 1: Create secret key from bot token
-    secret_key = hmac.digest(b"WebAppData", bot_token.encode(), hashlib.sha256)
+    secret_key = _webapp_secret_key(bot_token)
 
     # Step 2: Generate hash of data_check_string
     hash_value = hmac.new(secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
@@ -69,7 +77,7 @@ def generate_telegram_init_data(
     # Build final init_data with hash
     # IMPORTANT: Must use same JSON formatting as in data_check_string
     init_data_parts = {
-        "user": json.dumps(user_data, separators=(",", ":")),
+        "user": user_json,
         "auth_date": str(auth_date),
         "hash": hash_value,
     }
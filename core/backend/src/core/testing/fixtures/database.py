@@ -4,7 +4,7 @@ Provides production-parity testing environment using real PostgreSQL in Docker c
 
 Fixtures:
 - postgres_container: Session-scoped PostgreSQL container (shared across all tests)
-- db_engine: Function-scoped database engine connected to testcontainer
+- db_engine: Function-scoped database engine connected to testcontainer (schema created once)
 - db_session: Function-scoped database session with automatic transaction rollback
 """
 
@@ -17,6 +17,9 @@ from testcontainers.postgres import PostgresContainer
 
 from core.infrastructure.database.models.base import Base
 
+# Connection URLs whose schema is already created; tables outlive engines since tests roll back
+_schema_created: set[str] = set()
+
 
 @pytest.fixture(scope="session")
 def postgres_container():
@@ -34,7 +37,7 @@ async def db_engine(postgres_container: PostgresContainer) -> AsyncGenerator[Asy
     """Create async database engine connected to testcontainer.
 
     Function-scoped: New engine for each test (ensures isolation).
-    Creates all database tables from SQLAlchemy models.
+    Creates all database tables from SQLAlchemy models on first use per container.
 
     Note: We use function scope (not session) to ensure clean state.
     While session-scoped would be faster, it creates event loop compatibility
@@ -51,9 +54,11 @@ async def db_engine(postgres_container: PostgresContainer) -> AsyncGenerator[Asy
         pool_pre_ping=True,
     )
 
-    # Create all tables (happens EVERY test - slow!)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Create all tables once per container - later engines reuse them
+    if connection_url not in _schema_created:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        _schema_created.add(connection_url)
 
     yield engine
 
@@ -13,11 +13,14 @@ class InMemoryRedis:
     - get/set with TTL
     - delete
     - exists
-    - incr with expire
+    - incr / incrby with expire
+    - ttl / get_with_ttl
+    - set_and_index / expire_with_index / delete_and_unindex / smembers (sets kept as plain sets)
     """
 
     def __init__(self):
         self._data: dict[str, tuple[bytes, datetime | None]] = {}
+        self._sets: dict[str, set[bytes]] = {}
 
     async def get(self, key: str) -> bytes | None:
         """Get value, respecting TTL."""
@@ -37,12 +40,13 @@ class InMemoryRedis:
         self._data[key] = (value, expires_at)
         return True
 
-    async def delete(self, key: str) -> int:
-        """Delete key, return 1 if existed, 0 if not."""
-        if key in self._data:
-            del self._data[key]
-            return 1
-        return 0
+    async def delete(self, *keys: str) -> int:
+        """Delete keys, return how many existed."""
+        deleted = 0
+        for key in keys:
+            if self._data.pop(key, None) is not None:
+                deleted += 1
+        return deleted
 
     async def exists(self, key: str) -> int:
         """Check if key exists (respecting TTL)."""
@@ -59,6 +63,16 @@ class InMemoryRedis:
         await self.set(key, str(value))
         return value
 
+    async def incrby(self, key: str, amount: int, ex: int | None = None) -> int:
+        """Increment counter by amount, refreshing TTL if ex is given."""
+        current = await self.get(key)
+        value = (int(current) if current is not None else 0) + amount
+        expires_at = self._data[key][1] if current is not None else None
+        if ex:
+            expires_at = datetime.now(UTC) + timedelta(seconds=ex)
+        self._data[key] = (str(value).encode(), expires_at)
+        return value
+
     async def expire(self, key: str, seconds: int) -> bool:
         """Set TTL on existing key."""
         if key not in self._data:
@@ -68,9 +82,41 @@ class InMemoryRedis:
         self._data[key] = (value, expires_at)
         return True
 
+    async def ttl(self, key: str) -> int:
+        """Remaining TTL in seconds (-1 if no expiry, -2 if missing)."""
+        if await self.get(key) is None:
+            return -2
+        _, expires_at = self._data[key]
+        if expires_at is None:
+            return -1
+        return int((expires_at - datetime.now(UTC)).total_seconds())
+
+    async def get_with_ttl(self, key: str) -> tuple[bytes | None, int]:
+        """Get value and remaining TTL."""
+        return await self.get(key), await self.ttl(key)
+
+    async def set_and_index(self, key: str, value: str | bytes, ex: int, index_key: str, member: str) -> None:
+        """Set value and add member to the index set (set TTL not tracked)."""
+        await self.set(key, value, ex=ex)
+        self._sets.setdefault(index_key, set()).add(member.encode())
+
+    async def expire_with_index(self, key: str, seconds: int, index_key: str) -> None:
+        """Set TTL on key (set TTL not tracked)."""
+        await self.expire(key, seconds)
+
+    async def delete_and_unindex(self, keys: list[str], index_key: str, member: str) -> int:
+        """Delete keys and remove member from the index set."""
+        self._sets.get(index_key, set()).discard(member.encode())
+        return await self.delete(*keys)
+
+    async def smembers(self, key: str) -> list[bytes]:
+        """Get all members of a set."""
+        return list(self._sets.get(key, ()))
+
     def clear(self):
         """Clear all data (for test isolation)."""
         self._data.clear()
+        self._sets.clear()
 
 
 @pytest.fixture
@@ -5,7 +5,7 @@ Provides:
 - Background job execution utilities
 - Bot message/photo capture helpers
 - Time freezing utilities
-- Mock bot with message capture
+- Mock bot with message capture (and a variant whose sends fail)
 - Worker context setup utilities
 """
 
@@ -31,18 +31,20 @@ class CapturedMessage:
         chat_id: Telegram chat ID
         text: Message text or caption
         photo: Photo file ID (for send_photo calls)
+        document: Uploaded file or file ID (for send_document calls)
         kwargs: Additional arguments passed to send method
     """
 
-    def __init__(self, chat_id: int, text: str = None, photo: str = None, **kwargs):
+    def __init__(self, chat_id: int, text: str = None, photo: str = None, document: Any = None, **kwargs):
         self.chat_id = chat_id
         self.text = text
         self.photo = photo
+        self.document = document
         self.kwargs = kwargs
 
 
 class MockBot:
-    """Mock bot that captures sent messages and photos.
+    """Mock bot that captures sent messages, photos and documents.
 
     Provides a realistic bot interface for testing worker jobs that send
     Telegram messages. Captures all calls for assertion.
@@ -50,6 +52,7 @@ class MockBot:
     Attributes:
         messages: List of CapturedMessage objects from send_message calls
         photos: List of CapturedMessage objects from send_photo calls
+        documents: List of CapturedMessage objects from send_document calls
 
     Usage:
         async def test_notification(worker_ctx, mock_bot):
@@ -62,6 +65,17 @@ class MockBot:
     def __init__(self):
         self.messages: list[CapturedMessage] = []
         self.photos: list[CapturedMessage] = []
+        self.documents: list[CapturedMessage] = []
+
+    @property
+    def chat_ids(self) -> set[int]:
+        """Chat IDs that received a message."""
+        return {m.chat_id for m in self.messages}
+
+    @property
+    def texts(self) -> set[str]:
+        """Distinct texts of sent messages."""
+        return {m.text for m in self.messages}
 
     async def send_message(self, chat_id: int, text: str, **kwargs):
         """Capture send_message call and return mock result."""
@@ -73,13 +87,50 @@ class MockBot:
         self.photos.append(CapturedMessage(chat_id, text=caption, photo=photo, **kwargs))
         return MagicMock(message_id=len(self.photos))
 
+    async def send_document(self, chat_id: int, document: Any, caption: str = None, **kwargs):
+        """Capture send_document call and return mock result.
+
+        Like Telegram, an uploaded file gets a new file_id and a resent file_id is echoed back.
+        """
+        self.documents.append(CapturedMessage(chat_id, text=caption, document=document, **kwargs))
+        file_id = document if isinstance(document, str) else f"document_{len(self.documents)}"
+        return MagicMock(message_id=len(self.documents), document=MagicMock(file_id=file_id))
+
+    def clear(self):
+        """Forget captured messages, photos and documents (for test isolation)."""
+        self.messages.clear()
+        self.photos.clear()
+        self.documents.clear()
+
+
+# Raised for every failing chat; the traceback is reset on each raise so it doesn't grow
+SEND_FAILED = RuntimeError("Send failed")
+
+
+class FailingBot(MockBot):
+    """MockBot whose message and document sends to the given chat ids raise."""
+
+    def __init__(self, fail_chat_ids: set[int]):
+        super().__init__()
+        self.fail_chat_ids = fail_chat_ids
+
+    async def send_message(self, chat_id: int, text: str, **kwargs):
+        if chat_id in self.fail_chat_ids:
+            raise SEND_FAILED.with_traceback(None)
+        return await super().send_message(chat_id, text, **kwargs)
+
+    async def send_document(self, chat_id: int, document: Any, caption: str = None, **kwargs):
+        if chat_id in self.fail_chat_ids:
+            raise SEND_FAILED.with_traceback(None)
+        return await super().send_document(chat_id, document, caption=caption, **kwargs)
+
 
 @pytest_asyncio.fixture
 async def worker_mock_bot():
     """Mock bot that captures messages and photos for worker tests.
 
-    Returns MockBot instance with empty message/photo lists.
-    Use worker_mock_bot.messages and worker_mock_bot.photos for assertions.
+    Returns MockBot instance with empty message/photo/document lists.
+    Use worker_mock_bot.messages, .photos and .documents for assertions.
 
     Note: Use this in worker tests instead of the regular mock_bot fixture
     from bot.py, which is for testing bot handlers.
@@ -236,6 +287,7 @@ def create_mock_worker_dependencies():
         mocks = create_mock_worker_dependencies()
         ctx_dict = {
             **mocks,
+            "engine": db_engine,
             "session_pool": session_pool,
             "bot": mock_bot,
             "repo_class": RequestsRepo,
@@ -309,6 +361,7 @@ async def create_worker_context(
 
     # Create worker context dict with all dependencies
     ctx_dict = {
+        "engine": db_engine,
         "session_pool": session_pool,
         "bot": mock_bot,
         "repo_class": repo_class,
@@ -4,7 +4,7 @@ Uses testcontainers PostgreSQL for production-parity testing.
 Tests core database patterns: flush/refresh semantics and pessimistic locks.
 
 Test Organization:
-- CRUD operations (create, read, update, delete, upsert) - 13 tests
+- CRUD operations (create, bulk_create, read, update, delete, upsert) - 15 tests
 - Pessimistic locking (exclusive, shared, nowait, skip_locked) - 7 tests
 
 All tests use TestBalance model for simplicity.
@@ -19,6 +19,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.infrastructure.database.repo.base import BaseRepo
 
+pytestmark = pytest.mark.asyncio
+
 
 class TestBaseRepoCreate:
     """CRUD: Create operation tests."""
@@ -76,6 +78,31 @@ class TestBaseRepoCreate:
         # Transaction is still active, no commit called
         assert db_session.in_transaction()
 
+    @pytest.mark.contract
+    async def test_bulk_create_returns_models_in_input_order(
+        self,
+        balance_repo: BaseRepo,
+    ):
+        """bulk_create() inserts all rows and returns them in input order."""
+        # Arrange
+        rows = [{"user_id": 7, "credits": 10}, {"user_id": 8, "credits": 20}]
+
+        # Act
+        created = await balance_repo.bulk_create(rows)
+
+        # Assert
+        assert [(b.user_id, b.credits) for b in created] == [(7, 10), (8, 20)]
+        assert all(b.id is not None for b in created)
+        assert len(await balance_repo.get_by_ids([b.id for b in created])) == 2
+
+    @pytest.mark.contract
+    async def test_bulk_create_empty_returns_empty(
+        self,
+        balance_repo: BaseRepo,
+    ):
+        """bulk_create() with no rows is a no-op."""
+        assert await balance_repo.bulk_create([]) == []
+
 
 class TestBaseRepoRead:
     """CRUD: Read operation tests."""
@@ -0,0 +1,50 @@
+"""Unit tests for the config owner override in require_role.
+
+Owner telegram ids come from settings.rbac.owner_ids_set, a frozenset built
+when the settings load and rebuilt only when owner_ids is reassigned.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from core.auth.rbac import require_role
+from core.infrastructure.config import settings
+from core.infrastructure.database.models.enums import UserRole
+from core.schemas.users import UserSchema
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.contract
+class TestRequireRoleOwnerOverride:
+    """Test the owner_ids override in require_role's role_checker."""
+
+    async def test_config_owner_passes_any_role_check(self, monkeypatch):
+        """A telegram id listed in owner_ids passes regardless of its DB role."""
+        monkeypatch.setattr(settings.rbac, "owner_ids", [555])
+        role_checker = require_role(UserRole.ADMIN)
+        user = UserSchema(telegram_id=555, role=UserRole.USER)
+
+        assert await role_checker(user=user) is user
+
+    async def test_non_owner_without_role_is_forbidden(self, monkeypatch):
+        """Users outside owner_ids still need one of the allowed roles."""
+        monkeypatch.setattr(settings.rbac, "owner_ids", [555])
+        role_checker = require_role(UserRole.ADMIN)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await role_checker(user=UserSchema(telegram_id=556, role=UserRole.USER))
+
+        assert exc_info.value.status_code == 403
+
+    async def test_owner_ids_set_is_built_once_per_assignment(self, monkeypatch):
+        """owner_ids_set is reused across checks and follows reassignment of owner_ids."""
+        monkeypatch.setattr(settings.rbac, "owner_ids", [555])
+        owner_ids_set = settings.rbac.owner_ids_set
+
+        assert settings.rbac.owner_ids_set is owner_ids_set
+        assert owner_ids_set == frozenset({555})
+
+        monkeypatch.setattr(settings.rbac, "owner_ids", [777])
+
+        assert settings.rbac.owner_ids_set == frozenset({777})
@@ -191,6 +191,23 @@ class TestTelegramAuthenticatorVerification:
         with pytest.raises(InvalidInitDataError):
             authenticator.verify_token(corrupted_init_data)
 
+    @pytest.mark.contract
+    def test_verify_preserves_percent_sequences_in_user(self):
+        """Literal "%20" in user fields must survive validation (values are unquoted only once)."""
+        # Arrange
+        bot_token = "test_token_mno"
+        init_data = generate_telegram_init_data(
+            user_id=123456, username="test_user", first_name="50%20off", bot_token=bot_token
+        )
+        secret = generate_secret_key(bot_token)
+        authenticator = TelegramAuthenticator(secret)
+
+        # Act
+        user = authenticator.verify_token(init_data)
+
+        # Assert
+        assert user.first_name == "50%20off"
+
     @pytest.mark.contract
     def test_generate_secret_key_deterministic(self):
         """Secret key generation should be deterministic for same token."""